@@ -1,6 +1,7 @@
 """Code ingestion module for parsing git repositories and extracting code chunks."""
 
 import os
+import re
 import tempfile
 import shutil
 import git
@@ -16,6 +17,42 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRe
 
 console = Console()
 
+# JavaScript/TypeScript definitions, one alternative per construct in priority order.
+# Whitespace is matched with [^\S\n] so a match never spans lines when scanning a whole file.
+_JS_NAME = r'[a-zA-Z_][a-zA-Z0-9_]*'
+_JS_DEFINITION_RE = re.compile(
+    r'^(?:'
+    rf'[^\S\n]*function[^\S\n]+(?P<function>{_JS_NAME})[^\S\n]*\(.*?\)[^\S\n]*\{{'
+    rf'|[^\S\n]*(?:const|let|var)[^\S\n]+(?P<arrow>{_JS_NAME})[^\S\n]*=[^\S\n]*.*?=>[^\S\n]*\{{'
+    rf'|[^\S\n]*class[^\S\n]+(?P<class>{_JS_NAME})[^\S\n]*\{{'
+    rf'|[^\S\n]*(?P<method>{_JS_NAME})[^\S\n]*\(.*?\)[^\S\n]*\{{'
+    r')',
+    re.MULTILINE
+)
+
+# Lines per chunk when a file is split without regard to its definitions
+_FALLBACK_CHUNK_SIZE = 50
+
+
+def _chunk_lines(lines: List[str], chunk_size: int = _FALLBACK_CHUNK_SIZE) -> List[Dict[str, Any]]:
+    """Split source lines into fixed-size code chunks, skipping chunks that are only whitespace."""
+    chunks = []
+    for i in range(0, len(lines), chunk_size):
+        chunk_content = '\n'.join(lines[i:i + chunk_size])
+        if not chunk_content.strip():
+            continue
+        
+        end_line = min(i + chunk_size, len(lines))
+        chunks.append({
+            'name': f'chunk_{i // chunk_size + 1}',
+            'type': 'code_chunk',
+            'content': chunk_content,
+            'start_line': i + 1,
+            'end_line': end_line,
+            'line_range': f"{i + 1}-{end_line}"
+        })
+    return chunks
+
 
 class CodeIngestionEngine:
     """Engine for ingesting git repositories and extracting code chunks."""
@@ -85,16 +122,26 @@ class CodeIngestionEngine:
         
         console.print(f"Discovering code files with extensions: {', '.join(valid_extensions)}")
         
-        for root, dirs, files in os.walk(repo_path):
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            
-            for file in files:
-                file_path = os.path.join(root, file)
-                file_ext = os.path.splitext(file)[1].lower()
-                
-                if file_ext in valid_extensions:
-                    rel_path = os.path.relpath(file_path, repo_path)
-                    code_files.append(file_path)
+        extension_set = frozenset(valid_extensions)
+        excluded = frozenset(exclude_dirs)
+        
+        # Iterative scandir walk in os.walk order; excluded directories are pruned
+        # before they are ever opened and non-matching files never become paths
+        stack = [repo_path]
+        while stack:
+            current = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            if entry.name not in excluded and not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in extension_set:
+                            code_files.append(entry.path)
+            except OSError:
+                continue
+            stack.extend(reversed(subdirs))
         
         console.print(f"Found {len(code_files)} code files", style="green")
         return code_files
@@ -125,74 +172,41 @@ class CodeIngestionEngine:
                         })
             except SyntaxError:
                 # Fallback to chunking if AST parsing fails
-                chunk_size = 50
-                for i in range(0, len(lines), chunk_size):
-                    chunk_lines = lines[i:i + chunk_size]
-                    chunk_content = '\n'.join(chunk_lines)
-                    
-                    if chunk_content.strip():
-                        functions.append({
-                            'name': f'chunk_{i//chunk_size + 1}',
-                            'type': 'code_chunk',
-                            'content': chunk_content,
-                            'start_line': i + 1,
-                            'end_line': min(i + chunk_size, len(lines)),
-                            'line_range': f"{i + 1}-{min(i + chunk_size, len(lines))}"
-                        })
+                functions = _chunk_lines(lines)
         
         elif language in ['javascript', 'typescript']:
-            import re
-            
-            patterns = [
-                re.compile(r'^(\s*)(function)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(.*?\)\s*\{'),
-                re.compile(r'^(\s*)(const|let|var)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*.*?=>\s*\{'),
-                re.compile(r'^(\s*)(class)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\{'),
-                re.compile(r'^(\s*)([a-zA-Z_][a-zA-Z0-9_]*)\s*\(.*?\)\s*\{'),
-            ]
-            
-            for i, line in enumerate(lines):
-                for pattern in patterns:
-                    match = pattern.match(line)
-                    if match:
-                        indent_level = len(match.group(1))
-                        func_name = match.group(3) if len(match.groups()) >= 3 else match.group(2)
-                        
-                        brace_count = line.count('{') - line.count('}')
-                        end_line = i
-                        
-                        for j in range(i + 1, len(lines)):
-                            brace_count += lines[j].count('{') - lines[j].count('}')
-                            if brace_count == 0:
-                                end_line = j
-                                break
-                        
-                        func_content = '\n'.join(lines[i:end_line + 1])
-                        
-                        functions.append({
-                            'name': func_name,
-                            'type': 'function',
-                            'content': func_content,
-                            'start_line': i + 1,
-                            'end_line': end_line + 1,
-                            'line_range': f"{i + 1}-{end_line + 1}"
-                        })
+            # One scan over the whole file; at most one definition starts per line
+            i = 0
+            position = 0
+            for match in _JS_DEFINITION_RE.finditer(content):
+                i += content.count('\n', position, match.start())
+                position = match.start()
+                
+                func_name = match.group(match.lastgroup)
+                line = lines[i]
+                
+                brace_count = line.count('{') - line.count('}')
+                end_line = i
+                
+                for j in range(i + 1, len(lines)):
+                    brace_count += lines[j].count('{') - lines[j].count('}')
+                    if brace_count == 0:
+                        end_line = j
                         break
+                
+                func_content = '\n'.join(lines[i:end_line + 1])
+                
+                functions.append({
+                    'name': func_name,
+                    'type': 'function',
+                    'content': func_content,
+                    'start_line': i + 1,
+                    'end_line': end_line + 1,
+                    'line_range': f"{i + 1}-{end_line + 1}"
+                })
         
         if not functions:
-            chunk_size = 50
-            for i in range(0, len(lines), chunk_size):
-                chunk_lines = lines[i:i + chunk_size]
-                chunk_content = '\n'.join(chunk_lines)
-                
-                if chunk_content.strip():
-                    functions.append({
-                        'name': f'chunk_{i//chunk_size + 1}',
-                        'type': 'code_chunk',
-                        'content': chunk_content,
-                        'start_line': i + 1,
-                        'end_line': min(i + chunk_size, len(lines)),
-                        'line_range': f"{i + 1}-{min(i + chunk_size, len(lines))}"
-                    })
+            functions = _chunk_lines(lines)
         
         return functions
     
@@ -1,122 +1,237 @@
 """Configuration management for the Semantic Code Navigator."""
 
 import os
-from dataclasses import dataclass, field
-from typing import Optional, List
+import sys
+from dataclasses import InitVar, dataclass, field
+from functools import lru_cache
+from typing import ClassVar, Mapping, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Default values shared by every config instance, interned once at import
+_DEFAULT_HOST = sys.intern("127.0.0.1")
+_DEFAULT_DATABASE = sys.intern("mindsdb")
+_DEFAULT_KB_NAME = sys.intern("codebase_kb")
+_DEFAULT_EMBEDDING_MODEL = sys.intern("text-embedding-3-large")
+_DEFAULT_RERANKING_MODEL = sys.intern("gpt-3.5-turbo")
 
-@dataclass
+
+@lru_cache(maxsize=None)
+def _env(name: str, default: str = "") -> str:
+    """Read an environment variable once; call _env.cache_clear() after changing the environment."""
+    return os.environ.get(name, default)
+
+
+def env_bound(*fields: Tuple[str, str, object]):
+    """Class decorator filling fields left as None from environment variables.
+    
+    Each field is ``(attribute, environment variable, default)``; values are
+    converted to the type of the default. The generated ``__post_init__`` is
+    straight-line code, one assignment per field, followed by the class's own
+    ``__post_init__`` if it has one. Apply it below ``@dataclass`` on a class
+    declaring an ``env`` InitVar: variables are read from that mapping when one
+    is given, and from the (cached) process environment otherwise. Booleans are
+    rejected, as ``bool("false")`` is True.
+    """
+    def decorate(cls):
+        namespace = {"_env": _env, "_setattr": object.__setattr__, "_post_init": cls.__dict__.get("__post_init__")}
+        lines = ["def __post_init__(self, env=None):", "    get = _env if env is None else env.get"]
+        for attr, env_var, default in fields:
+            if not attr.isidentifier():
+                raise ValueError(f"Invalid field name: {attr!r}")
+            if isinstance(default, bool):
+                raise TypeError(f"Boolean default for {attr!r} cannot be parsed from the environment")
+            namespace[f"_{attr}_default"] = sys.intern(str(default))
+            value = f"get({env_var!r}, _{attr}_default)"
+            if not isinstance(default, str):
+                namespace[f"_{attr}_type"] = type(default)
+                value = f"_{attr}_type({value})"
+            lines.append(f"    if self.{attr} is None:")
+            lines.append(f"        _setattr(self, {attr!r}, {value})")
+        if namespace["_post_init"] is not None:
+            lines.append("    _post_init(self)")
+        
+        exec("\n".join(lines), namespace)
+        post_init = namespace["__post_init__"]
+        post_init.__qualname__ = f"{cls.__qualname__}.__post_init__"
+        post_init.__doc__ = "Fill unset fields from the environment."
+        cls.__post_init__ = post_init
+        return cls
+    return decorate
+
+
+@dataclass(frozen=True)
+@env_bound(
+    ("host", "MINDSDB_HOST", _DEFAULT_HOST),
+    ("port", "MINDSDB_PORT", 47334),
+    ("user", "MINDSDB_USER", ""),
+    ("password", "MINDSDB_PASSWORD", ""),
+    ("database", "MINDSDB_DATABASE", _DEFAULT_DATABASE),
+)
 class MindsDBConfig:
-    """MindsDB connection configuration."""
-    host: str = field(default_factory=lambda: os.getenv("MINDSDB_HOST", "127.0.0.1"))
-    port: int = field(default_factory=lambda: int(os.getenv("MINDSDB_PORT", "47334")))
-    user: str = field(default_factory=lambda: os.getenv("MINDSDB_USER", ""))
-    password: str = field(default_factory=lambda: os.getenv("MINDSDB_PASSWORD", ""))
-    database: str = field(default_factory=lambda: os.getenv("MINDSDB_DATABASE", "mindsdb"))
+    """MindsDB connection configuration.
     
-    @property
-    def connection_url(self) -> str:
-        """Get HTTP connection URL for configured host and port."""
-        return f"http://{self.host}:{self.port}"
+    Built without ``env``, it reads the process environment through the _env cache,
+    so environment changes made after the first read are ignored until
+    _env.cache_clear() or AppConfig.load_from_env() runs.
+    """
+    host: Optional[str] = None
+    port: Optional[int] = None
+    user: Optional[str] = None
+    password: Optional[str] = None
+    database: Optional[str] = None
+    connection_url: str = field(init=False, repr=False, compare=False)
+    is_cloud_connection: bool = field(init=False, repr=False, compare=False)
+    env: InitVar[Optional[Mapping[str, str]]] = None
     
-    @property
-    def is_cloud_connection(self) -> bool:
-        """Check if cloud credentials are configured for remote connection."""
-        return bool(self.user and self.password)
+    def __post_init__(self):
+        """Derive the HTTP connection URL and whether cloud credentials are configured."""
+        object.__setattr__(self, "connection_url", f"http://{self.host}:{self.port}")
+        object.__setattr__(self, "is_cloud_connection", bool(self.user and self.password))
 
 
-@dataclass
+@dataclass(frozen=True)
+@env_bound(
+    ("name", "KB_NAME", _DEFAULT_KB_NAME),
+    ("embedding_model", "EMBEDDING_MODEL", _DEFAULT_EMBEDDING_MODEL),
+    ("reranking_model", "RERANKING_MODEL", _DEFAULT_RERANKING_MODEL),
+    ("openai_api_key", "OPENAI_API_KEY", ""),
+)
 class KnowledgeBaseConfig:
-    """Knowledge Base configuration."""
-    name: str = field(default_factory=lambda: os.getenv("KB_NAME", "codebase_kb"))
-    embedding_model: str = field(default_factory=lambda: os.getenv("EMBEDDING_MODEL", "text-embedding-3-large"))
-    reranking_model: str = field(default_factory=lambda: os.getenv("RERANKING_MODEL", "gpt-3.5-turbo"))
-    openai_api_key: str = field(default_factory=lambda: os.getenv("OPENAI_API_KEY", ""))
-    metadata_columns: List[str] = field(default_factory=lambda: [
-        'filepath', 'language', 'function_name', 'repo', 
-        'last_modified', 'author', 'line_range'
-    ])
-    content_columns: List[str] = field(default_factory=lambda: ['code_chunk'])
-    id_column: str = "chunk_id"
+    """Knowledge Base configuration.
     
-    def __post_init__(self):
-        """Initialize default metadata and content columns if not configured."""
-        if self.metadata_columns is None:
-            self.metadata_columns = [
-                'filepath',
-                'language',
-                'function_name',
-                'repo',
-                'last_modified',
-                'author',
-                'line_range'
-            ]
-        if self.content_columns is None:
-            self.content_columns = [
-                'code_chunk'
-            ]
-    
-    @property
-    def required_columns(self) -> list:
-        """Get essential columns required for basic stress testing functionality."""
-        return [
-            'content',
-            'filepath', 
-            'language',
-            'function_name',
-            'repo',
-            'last_modified'
-        ]
+    Built without ``env``, it reads the cached process environment; see MindsDBConfig.
+    """
+    name: Optional[str] = None
+    embedding_model: Optional[str] = None
+    reranking_model: Optional[str] = None
+    openai_api_key: Optional[str] = None
+    id_column: str = "chunk_id"
+    env: InitVar[Optional[Mapping[str, str]]] = None
     
-    @property
-    def optional_columns(self) -> list:
-        """Get optional columns that enhance search and filtering capabilities."""
-        return [
-            'author',
-            'line_range', 
-            'summary'
-        ]
+    # The knowledge base schema is the same for every instance, so it is shared
+    metadata_columns: ClassVar[Tuple[str, ...]] = (
+        'filepath',
+        'language',
+        'function_name',
+        'repo',
+        'last_modified',
+        'author',
+        'line_range'
+    )
+    content_columns: ClassVar[Tuple[str, ...]] = ('code_chunk',)
+    # Essential columns required for basic stress testing functionality
+    required_columns: ClassVar[Tuple[str, ...]] = (
+        'content',
+        'filepath',
+        'language',
+        'function_name',
+        'repo',
+        'last_modified'
+    )
+    # Optional columns that enhance search and filtering capabilities
+    optional_columns: ClassVar[Tuple[str, ...]] = (
+        'author',
+        'line_range',
+        'summary'
+    )
+    _all_columns: ClassVar[Tuple[str, ...]] = metadata_columns + content_columns
     
     @property
     def all_columns(self) -> list:
         """Get combined list of all metadata and content columns."""
-        return self.metadata_columns + self.content_columns
+        return list(self._all_columns)
 
 
-@dataclass
+@dataclass(frozen=True)
+@env_bound(
+    ("max_concurrent_queries", "MAX_CONCURRENT_QUERIES", 100),
+    ("stress_test_duration", "STRESS_TEST_DURATION", 300),
+    ("batch_size", "BATCH_SIZE", 500),
+    ("threads", "THREADS", 10),
+)
 class StressTestConfig:
-    """Stress testing configuration."""
-    max_concurrent_queries: int = field(default_factory=lambda: int(os.getenv("MAX_CONCURRENT_QUERIES", "100")))
-    stress_test_duration: int = field(default_factory=lambda: int(os.getenv("STRESS_TEST_DURATION", "300")))
-    batch_size: int = field(default_factory=lambda: int(os.getenv("BATCH_SIZE", "500")))
-    threads: int = field(default_factory=lambda: int(os.getenv("THREADS", "10")))
+    """Stress testing configuration.
+    
+    Built without ``env``, it reads the cached process environment; see MindsDBConfig.
+    """
+    max_concurrent_queries: Optional[int] = None
+    stress_test_duration: Optional[int] = None
+    batch_size: Optional[int] = None
+    threads: Optional[int] = None
+    env: InitVar[Optional[Mapping[str, str]]] = None
 
 
 @dataclass
 class AppConfig:
-    """Main application configuration."""
+    """Main application configuration.
+    
+    A process-wide singleton: every AppConfig() call returns the same instance,
+    built from the environment on first use. After reset() the next AppConfig()
+    call builds a new instance; modules that bound ``config`` at import (``from
+    .config import config``) keep the old object, so call load_from_env() on it to
+    reload settings everywhere. Passing an ``env`` mapping instead builds a separate
+    instance from that mapping.
+    """
     mindsdb: MindsDBConfig = field(default_factory=MindsDBConfig)
     kb: KnowledgeBaseConfig = field(default_factory=KnowledgeBaseConfig)
     stress_test: StressTestConfig = field(default_factory=StressTestConfig)
     
-    def __init__(self):
-        self.load_from_env()
+    _instance = None
+    
+    def __new__(cls, env: Optional[Mapping[str, str]] = None):
+        if env is not None:
+            return super().__new__(cls)
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+    
+    def __init__(self, env: Optional[Mapping[str, str]] = None):
+        if getattr(self, "_initialized", False):
+            return
+        self.load_from_env(env)
+        self._initialized = True
+    
+    @classmethod
+    def reset(cls):
+        """Drop the shared instance so the next AppConfig() builds a new one.
+        
+        Existing references, such as a ``config`` imported by another module, still
+        point at the old instance.
+        """
+        cls._instance = None
+    
+    def load_from_env(self, env: Optional[Mapping[str, str]] = None):
+        """Load configuration from environment variables, or from env if given."""
+        if env is None:
+            load_dotenv()
+            _env.cache_clear()
+        self.mindsdb = MindsDBConfig(env=env)
+        self.kb = KnowledgeBaseConfig(env=env)
+        self.stress_test = StressTestConfig(env=env)
+        self.invalidate()
     
-    def load_from_env(self):
-        """Load configuration from environment variables."""
-        load_dotenv()
-        self.mindsdb = MindsDBConfig()
-        self.kb = KnowledgeBaseConfig()
-        self.stress_test = StressTestConfig()
+    def invalidate(self):
+        """Forget a previous successful validation so the next validate() checks again."""
+        self._validated = False
     
     def validate(self) -> bool:
-        """Validate required configuration parameters and raise error if missing."""
+        """Validate required configuration parameters and raise error if missing.
+        
+        A successful validation is remembered until the configuration is reloaded or
+        invalidate() is called; failures are not, so callers can retry after fixing them.
+        """
+        if self._validated:
+            return True
         if not self.kb.openai_api_key:
             raise ValueError("OPENAI_API_KEY is required")
+        self._validated = True
         return True
 
 
-config = AppConfig() 
\ No newline at end of file
+def __getattr__(name: str):
+    """Build the shared ``config`` on first access instead of at import time."""
+    if name == "config":
+        return AppConfig()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
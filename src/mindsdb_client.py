@@ -26,8 +26,7 @@ class MindsDBClient:
         """Establish connection to MindsDB using configured host/credentials or default local instance."""
         try:
             if config.mindsdb.host and config.mindsdb.port:
-                connection_url = f"http://{config.mindsdb.host}:{config.mindsdb.port}"
-                self.server = mindsdb_sdk.connect(connection_url)
+                self.server = mindsdb_sdk.connect(config.mindsdb.connection_url)
             else:
                 if config.mindsdb.user and config.mindsdb.password:
                     self.server = mindsdb_sdk.connect(
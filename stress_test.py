@@ -10,15 +10,27 @@ documenting results in real-time with beautiful markdown reports.
 import os
 import sys
 import time
+import io
 import json
+import random
+import re
+import atexit
+import shlex
 import subprocess
 import platform
+import threading
+from collections import OrderedDict, deque
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
+from functools import lru_cache
 from pathlib import Path
 import psutil
 import statistics
+import numpy as np
+import pandas as pd
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
 from rich.table import Table
@@ -29,6 +41,53 @@ from rich.text import Text
 
 console = Console()
 
+# CLI output parsers, compiled once for every repository test
+_NUM_RE = re.compile(r'\d+')
+_FOUND_RE = re.compile(r'Found (\d+) results')
+_LANG_LINE_RE = re.compile(r'^[^\S\n]*([^:\n]*[^:\s])[^\S\n]*:[^\S\n]*(\d+)[^\S\n]*chunks', re.MULTILINE)
+
+# CLI commands whose successful results may be reused, mapped to the command
+# prefixes that change the state they act on and therefore invalidate them
+_CACHEABLE_COMMANDS = {
+    "ai:init --force": ("ai:reset",),
+    "kb:index --show-stats": ("kb:reset", "kb:ingest", "kb:init"),
+}
+_CMD_CACHE_SIZE = 256
+_CMD_CACHE_TTL = 120.0
+_CMD_CACHE_MIN_SECONDS = 1.0
+
+# Most CLI commands that may hit MindsDB at the same time, whatever the number of parallel repositories
+_MAX_CONCURRENT_MINDSDB_CALLS = 2
+# Long-running commands that do not take a MindsDB call slot, so that ingesting
+# repositories cannot hold off the short calls of every other repository
+_UNTHROTTLED_COMMANDS = ("kb:ingest",)
+
+# Adaptive batch sizing
+_MAX_BATCH_SIZE = 2000
+_MAX_BATCH_SIZES_PER_REPO = 3
+_EST_CHUNKS_PER_FILE = 2
+_BATCH_SIZE_ERRORS = ("timed out", "timeout", "memory", "oom", "killed")
+
+# Retry pacing: only transient failures back off exponentially
+_TRANSIENT_ERRORS = ("rate limit", "timeout", "timed out", "connection", "429", "503")
+_RETRY_AFTER_RE = re.compile(r'Retry-After:\s*(\d+)', re.IGNORECASE)
+_FAST_RETRY_DELAY = 0.5
+_MAX_BACKOFF_SECONDS = 30
+# Transient failures that need no wait once a health probe finds MindsDB reachable again
+_CONNECTION_ERRORS = ("connection", "503")
+_HEALTH_PROBE_TIMEOUT = 10
+# kb:status exits 0 even when its queries fail, so its output is checked as well
+_UNHEALTHY_STATUS_MARKERS = ("Failed to connect", "Connection refused", "Failed to establish", "Query execution failed")
+
+# Search query sampling
+_QUERIES_PER_TEST = 3
+_QUERY_COST_WINDOW = 32
+_QUERY_SAMPLE_SEED = 42
+
+# Longest CLI step; resource samples are kept long enough to cover it twice over
+_INGESTION_TIMEOUT = 1800
+_SAMPLE_WINDOW_SECONDS = 2 * _INGESTION_TIMEOUT
+
 @dataclass
 class TestRepository:
     """Repository configuration for stress testing."""
@@ -84,25 +143,32 @@ class StatisticalMetrics:
     confidence_interval_95: tuple = (0.0, 0.0)
     coefficient_variation: float = 0.0
     outliers_count: int = 0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
     
     @classmethod
     def from_values(cls, values: List[float]) -> 'StatisticalMetrics':
         """Calculate statistical metrics from a list of values."""
-        if not values:
+        if not len(values):
+            return cls()
+        return cls.from_ndarray(np.asarray(values, dtype=np.float64))
+    
+    @classmethod
+    def from_ndarray(cls, arr: np.ndarray) -> 'StatisticalMetrics':
+        """Calculate statistical metrics from a float64 array with vectorized reductions."""
+        n = arr.size
+        if n == 0:
             return cls()
         
-        import statistics
-        import math
-        
-        mean = statistics.mean(values)
-        median = statistics.median(values)
-        std_dev = statistics.stdev(values) if len(values) > 1 else 0.0
-        min_val = min(values)
-        max_val = max(values)
+        mean = float(arr.mean())
+        q1, p50, q3, p95, p99 = np.percentile(arr, [25, 50, 75, 95, 99], method='linear')
+        median = float(p50)
+        std_dev = float(arr.std(ddof=1)) if n > 1 else 0.0
         
         # Calculate 95% confidence interval
-        if len(values) > 1:
-            margin_error = 1.96 * (std_dev / math.sqrt(len(values)))
+        if n > 1:
+            margin_error = 1.96 * (std_dev / np.sqrt(n))
             ci_95 = (mean - margin_error, mean + margin_error)
         else:
             ci_95 = (mean, mean)
@@ -110,18 +176,22 @@ class StatisticalMetrics:
         # Coefficient of variation
         cv = (std_dev / mean * 100) if mean > 0 else 0.0
         
-        # Count outliers (values beyond 2 standard deviations)
-        outliers = sum(1 for v in values if abs(v - mean) > 2 * std_dev)
+        # Count outliers (values beyond 1.5 IQR from the quartiles)
+        iqr = q3 - q1
+        outliers = int(np.count_nonzero((arr < q1 - 1.5 * iqr) | (arr > q3 + 1.5 * iqr)))
         
         return cls(
             mean=mean,
             median=median,
             std_dev=std_dev,
-            min_value=min_val,
-            max_value=max_val,
+            min_value=float(arr.min()),
+            max_value=float(arr.max()),
             confidence_interval_95=ci_95,
             coefficient_variation=cv,
-            outliers_count=outliers
+            outliers_count=outliers,
+            p50=median,
+            p95=float(p95),
+            p99=float(p99)
         )
 
 @dataclass
@@ -180,18 +250,15 @@ class PerformanceMetrics:
             self.ingestion_rate_files_per_second = result.files_processed / result.ingestion_time
             
         if search_times:
-            search_times_ms = [t * 1000 for t in search_times]
-            self.search_latency_avg_ms = statistics.mean(search_times_ms)
+            # Statistical analysis of search times, computed once; the headline
+            # latency metrics and report sections all read from it
+            self.search_latency_stats = StatisticalMetrics.from_ndarray(np.asarray(search_times, dtype=np.float64) * 1000)
+            self.search_latency_avg_ms = self.search_latency_stats.mean
             
             # Enhanced percentile calculations
-            if len(search_times_ms) >= 5:
-                sorted_times = sorted(search_times_ms)
-                n = len(sorted_times)
-                self.search_latency_p95_ms = sorted_times[int(0.95 * n)]
-                self.search_latency_p99_ms = sorted_times[int(0.99 * n)] if n >= 10 else sorted_times[-1]
-            
-            # Statistical analysis of search times
-            self.search_latency_stats = StatisticalMetrics.from_values(search_times_ms)
+            if len(search_times) >= 5:
+                self.search_latency_p95_ms = self.search_latency_stats.p95
+                self.search_latency_p99_ms = self.search_latency_stats.p99
             
         if result.peak_memory_mb > 0 and result.chunks_extracted > 0:
             self.memory_efficiency_mb_per_1k_chunks = (result.peak_memory_mb / result.chunks_extracted) * 1000
@@ -288,6 +355,9 @@ class TestResult:
     peak_memory_mb: float = 0.0
     cpu_usage_percent: float = 0.0
     
+    estimated_cost: float = 0.0
+    size_category: str = ""
+    
     environment: Optional[TestEnvironment] = None
     performance: Optional[PerformanceMetrics] = None
     language_breakdown: Dict[str, int] = None
@@ -316,289 +386,168 @@ class TestResult:
         ])
         return (successful_steps / total_steps) * 100
 
-class StressTestSuite:
-    """Main stress testing suite."""
-    
-    def __init__(self):
-        self.results: List[TestResult] = []
-        self.start_time = datetime.now()
-        self.report_file = f"stress_test_report_{self.start_time.strftime('%Y%m%d_%H%M%S')}.md"
-        self.cli_path = "python -m src.cli"
-        self.results_dir = Path("results")
-        self.results_dir.mkdir(exist_ok=True)
-        
-        self.test_repositories = [
-            # Small repositories (30-80 files) - Quick tests
-            TestRepository("flask-microblog", "https://github.com/miguelgrinberg/microblog", 50, "Python", "Flask microblog tutorial", 100, 10),
-            TestRepository("calculator", "https://github.com/Abdulvoris101/Vue-Calculator", 40, "JavaScript", "Express.js web framework", 80, 12),
-            TestRepository("vue-calculator", "https://github.com/ahfarmer/calculator", 35, "JavaScript", "Simple calculator app", 70, 10),
-            TestRepository("todo", "https://github.com/tusharnankani/ToDoList", 80, "JavaScript", "TodoMVC React implementation", 160, 16),
-            TestRepository("react-weather-app", "https://github.com/Adedoyin-Emmanuel/react-weather-app", 60, "JavaScript", "React app generator", 120, 15),
-            
-            # Medium repositories (80-150 files) - Moderate tests  
-            TestRepository("fastapi-example", "https://github.com/tiangolo/full-stack-fastapi-postgresql", 90, "Python", "FastAPI full-stack example", 180, 18),
-            TestRepository("gin-rest-api", "https://github.com/gin-gonic/gin", 120, "Go", "Gin REST API example", 240, 20),
-            TestRepository("vue-cli", "https://github.com/vuejs/vue-cli", 100, "JavaScript", "Vue.js CLI tool", 200, 18),
-        ]
-        
-        self.search_queries = [
-            "authentication and login validation",
-            "database connection and queries",
-            "error handling and logging",
-            "API endpoint routing",
-            "data validation and sanitization",
-            "file upload and processing",
-            "caching and performance optimization",
-            "security and authorization",
-            "testing and unit tests",
-            "configuration and environment setup"
-        ]
-        
-        self.ai_analysis_types = [
-            "--classify",
-            "--explain", 
-            "--docstring",
-            "--tests",
-            "--all"
-        ]
+class _SafeDict(dict):
+    """Mapping for ``str.format_map`` that renders missing keys as "N/A"."""
     
-    def initialize_report(self):
-        """Initialize the markdown report file."""
-        with open(self.report_file, 'w') as f:
-            f.write(f"""# Semantic Code Navigator - Comprehensive Stress Test Report
-
-**Test Suite Started:** {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}
-
-## Test Overview
-
-This comprehensive stress test evaluates the complete workflow of the Semantic Code Navigator:
-
-1. **Knowledge Base Creation** - Initialize MindsDB KB with embedding models
-2. **Data Ingestion** - Clone repositories and extract code chunks  
-3. **Index Creation** - Optimize KB for search performance
-4. **Semantic Search** - Query with natural language and metadata filters
-5. **AI Analysis** - Enhance results with AI tables for classification and explanation
-
-### Test Repositories
-
-Testing on **{len(self.test_repositories)}** repositories ranging from ~50 to 3000+ files:
-
-| Repository | Est. Files | Language | Batch Size | Max Queries | Description |
-|------------|------------|----------|------------|-------------|-------------|
-""")
-            
-            for repo in self.test_repositories:
-                f.write(f"| {repo.name} | {repo.estimated_files} | {repo.language} | {repo.batch_size} | {repo.max_concurrent_queries} | {repo.description} |\n")
-            
-            f.write(f"""
-### Test Parameters
-
-- **Search Queries:** {len(self.search_queries)} different semantic queries
-- **Batch Size Variation:** From 100 to 1000 based on repository size
-- **Test Execution:** Serial execution (one repository at a time)
-- **Memory Management:** KB reset after each test to free memory
-- **Cost Optimization:** No AI summary generation to reduce OpenAI costs
-- **Individual Reports:** Detailed benchmark reports saved to `results/` directory
-- **Performance Metrics:** P95/P99 latency, throughput, memory efficiency tracking
-
----
+    def __missing__(self, key):
+        return "N/A"
 
-## Test Results
-
-""")
+def _write_report_file(path, text: str):
+    """Write report text as UTF-8 bytes, bypassing the buffered text I/O stack."""
+    data = memoryview(text.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+@lru_cache(maxsize=1024)
+def _processing_cost(chunks: int, queries: int, ai_analysis_success: bool) -> float:
+    """Estimate OpenAI API processing costs from the inputs that drive them."""
+    # Rough estimates based on typical usage
+    embedding_cost = chunks * 0.0001  # ~$0.0001 per chunk
+    search_cost = queries * 0.001  # ~$0.001 per query
+    ai_analysis_cost = queries * 0.01 if ai_analysis_success else 0  # ~$0.01 per AI analysis
+    return embedding_cost + search_cost + ai_analysis_cost
+
+@lru_cache(maxsize=None)
+def _size_category(chunks: int) -> str:
+    """Get repository size category for a chunk count."""
+    if chunks < 500: return "Small"
+    elif chunks < 2000: return "Medium"
+    elif chunks < 5000: return "Large"
+    else: return "Very Large"
+
+# Column layout of the per-result metrics kept alongside StressTestSuite.results
+_RESULT_METRICS_DTYPE = np.dtype([
+    ('ingestion_time', 'f8'),
+    ('search_time', 'f8'),
+    ('success_rate', 'f8'),
+    ('has_perf', '?'),
+    ('ing_rate', 'f8'),
+    ('lat_ms', 'f8'),
+    ('mem_eff', 'f8'),
+    ('mem_peak', 'f8'),
+    ('growth', 'f8'),
+    ('psi', 'f8'),
+    ('rel_perf', 'f8'),
+    ('cv_latency', 'f8'),
+    ('chunks', 'i8'),
+    ('batch', 'i4'),
+    ('results_count', 'i8'),
+    ('queries', 'i8'),
+])
+
+def _result_metrics_row(result: TestResult) -> tuple:
+    """Flatten a test result into a row of _RESULT_METRICS_DTYPE."""
+    perf = result.performance
+    if perf is None:
+        return (result.ingestion_time, result.search_time, result.success_rate, False,
+                0.0, 0.0, 0.0, result.peak_memory_mb, 0.0, 0.0, 0.0, np.nan,
+                result.chunks_extracted, result.batch_size, result.search_results_count, result.queries_tested)
+    
+    cv_latency = perf.search_latency_stats.coefficient_variation if perf.search_latency_stats else np.nan
+    return (result.ingestion_time, result.search_time, result.success_rate, True,
+            perf.ingestion_rate_chunks_per_second, perf.search_latency_avg_ms,
+            perf.memory_efficiency_mb_per_1k_chunks, result.peak_memory_mb, perf.memory_growth_rate,
+            perf.performance_stability_index, perf.relative_performance_vs_baseline, cv_latency,
+            result.chunks_extracted, result.batch_size, result.search_results_count, result.queries_tested)
+
+class ResultsFrame:
+    """Column-wise store of per-result metrics backed by a _RESULT_METRICS_DTYPE array.
+    
+    Rows go into spare capacity that doubles when exhausted, so recording a result
+    is amortized O(1) instead of copying every column on each append.
+    """
+    
+    def __init__(self, capacity: int = 16):
+        self._data = np.empty(capacity, dtype=_RESULT_METRICS_DTYPE)
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, result: TestResult):
+        """Flatten a result into the next free row, growing the storage if needed."""
+        if self._size == len(self._data):
+            grown = np.empty(max(1, 2 * len(self._data)), dtype=_RESULT_METRICS_DTYPE)
+            grown[:self._size] = self._data
+            self._data = grown
+        self._data[self._size] = _result_metrics_row(result)
+        self._size += 1
     
-    def _escape_markdown(self, text: str) -> str:
-        """Escape special markdown characters to prevent formatting issues."""
-        if not text:
-            return text
-        
-        # Escape common markdown special characters that could break formatting
-        escape_chars = ['*', '_', '`', '#', '[', ']', '(', ')', '|', '\\']
-        for char in escape_chars:
-            text = text.replace(char, f'\\{char}')
-        
-        return text
+    @property
+    def columns(self) -> np.ndarray:
+        """View of the filled rows; index it by field name to get a column."""
+        return self._data[:self._size]
 
-    def update_report(self, message: str, level: str = "info"):
-        """Update the report with real-time information and appropriate status indicators.
-        
-        Appends timestamped messages to the markdown report file with level-specific
-        indicators for tracking test progress and results.
-        """
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        
-        # Escape markdown special characters to prevent formatting issues
-        safe_message = self._escape_markdown(message)
-        
-        level_indicators = {
-            "info": "[INFO]",
-            "success": "[SUCCESS]", 
-            "warning": "[WARNING]",
-            "error": "[ERROR]",
-            "start": "[START]",
-            "finish": "[COMPLETE]"
-        }
-        
-        try:
-            with open(self.report_file, 'a', encoding='utf-8') as f:
-                f.write(f"\n**{timestamp}** {level_indicators.get(level, '[INFO]')} {safe_message}\n")
-                f.flush()
-        except Exception as e:
-            console.print(f"Failed to update report: {e}", style="red")
+class _ResourceSampler:
+    """Background sampler of this process's memory and CPU usage.
     
-    def detect_repository_branch(self, repo_url: str) -> str:
-        """Detect the default branch of a repository (main vs master)."""
-        try:
-            console.print(f"Detecting branch for {repo_url}...", style="dim")
-            
-            result = subprocess.run(
-                f"git ls-remote --heads {repo_url}",
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                branches = result.stdout.strip()
-                if "refs/heads/main" in branches:
-                    console.print("Detected branch: main", style="dim")
-                    return "main"
-                elif "refs/heads/master" in branches:
-                    console.print("Detected branch: master", style="dim")
-                    return "master"
-                else:
-                    lines = branches.split('\n')
-                    for line in lines:
-                        if 'refs/heads/' in line:
-                            branch_name = line.split('refs/heads/')[-1]
-                            if branch_name in ['develop', 'dev', 'trunk']:
-                                console.print(f"Detected branch: {branch_name}", style="dim")
-                                return branch_name
-                    if lines and 'refs/heads/' in lines[0]:
-                        branch_name = lines[0].split('refs/heads/')[-1]
-                        console.print(f"Using first available branch: {branch_name}", style="dim")
-                        return branch_name
-            
-            console.print("Using default branch: main", style="dim")
-            return "main"
-            
-        except Exception as e:
-            console.print(f"Branch detection failed for {repo_url}: {e}", style="yellow")
-            return "main"
-
-    def run_cli_command(self, command: str, timeout: int = 300, retries: int = 2) -> Tuple[bool, str, float]:
-        """Execute CLI command with real-time output display and retry logic.
-        
-        Runs the specified CLI command and streams output in real-time to the console.
-        Implements retry logic for connection failures and provides detailed error reporting.
-        """
-        start_time = time.time()
-        
-        for attempt in range(retries + 1):
+    Keeps a rolling window of ``(timestamp, rss_mb, cpu_percent)`` samples so that
+    readers get peak values without querying psutil on demand. The window spans
+    window_seconds, long enough to hold the peak of a whole repository test.
+    """
+    
+    def __init__(self, interval: float = 0.5, window_seconds: float = _SAMPLE_WINDOW_SECONDS):
+        self.interval = interval
+        self.samples: deque = deque(maxlen=int(window_seconds / interval) + 1)
+        self._process = psutil.Process()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the sampler thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self):
+        """Start sampling; does nothing if the sampler is already running."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop sampling and wait for the sampler thread to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self):
+        while not self._stop_event.is_set():
             try:
-                full_command = f"{self.cli_path} {command}"
-                if attempt > 0:
-                    console.print(f"Retry {attempt}: [bold cyan]{full_command}[/bold cyan]", style="yellow")
-                else:
-                    console.print(f"Running: [bold cyan]{full_command}[/bold cyan]")
-                
-                process = subprocess.Popen(
-                    full_command,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True
-                )
-                
-                output_lines = []
-                while True:
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output:
-                        print(output.rstrip())
-                        output_lines.append(output.strip())
-                
-                process.wait()
-                execution_time = time.time() - start_time
-                full_output = '\n'.join(output_lines)
-                
-                if process.returncode == 0:
-                    return True, full_output, execution_time
-                else:
-                    connection_errors = [
-                        "Connection aborted",
-                        "Remote end closed connection",
-                        "Connection refused",
-                        "Connection timed out",
-                        "Failed to connect"
-                    ]
-                    
-                    if attempt < retries and any(err in full_output for err in connection_errors):
-                        console.print(f"Connection issue detected, retrying in 5 seconds...", style="yellow")
-                        time.sleep(5)
-                        continue
-                    
-                    return False, full_output, execution_time
-                    
-            except subprocess.TimeoutExpired:
-                execution_time = time.time() - start_time
-                if attempt < retries:
-                    console.print(f"Command timed out, retrying...", style="yellow")
-                    time.sleep(5)
-                    continue
-                return False, f"Command timed out after {timeout} seconds", execution_time
-            except Exception as e:
-                execution_time = time.time() - start_time
-                if attempt < retries:
-                    console.print(f"Command failed with exception, retrying...", style="yellow")
-                    time.sleep(5)
-                    continue
-                return False, str(e), execution_time
-        
-        execution_time = time.time() - start_time
-        return False, "All retry attempts failed", execution_time
+                self.samples.append((time.time(), self._process.memory_info().rss / 1024 / 1024, self._process.cpu_percent()))
+            except psutil.Error:
+                pass
+            self._stop_event.wait(self.interval)
     
-    def monitor_system_resources(self, result: TestResult):
-        """Monitor system resources during test execution."""
-        try:
-            process = psutil.Process()
-            result.peak_memory_mb = max(result.peak_memory_mb, process.memory_info().rss / 1024 / 1024)
-            result.cpu_usage_percent = max(result.cpu_usage_percent, process.cpu_percent())
-        except:
-            pass
+    def peak_since(self, since: float) -> Optional[Tuple[float, float]]:
+        """Get peak ``(rss_mb, cpu_percent)`` of the samples taken since the given time."""
+        window = [sample for sample in list(self.samples) if sample[0] >= since]
+        if not window:
+            return None
+        return max(sample[1] for sample in window), max(sample[2] for sample in window)
     
-    def generate_individual_report(self, result: TestResult, repo: TestRepository):
-        """Generate detailed individual repository benchmark report.
-        
-        Creates a comprehensive report for a single repository test including
-        environment specifications, performance metrics, statistical analysis,
-        and critical optimization insights for reproducible benchmarks.
-        """
-        timestamp = result.start_time.strftime('%Y%m%d_%H%M%S')
-        report_file = self.results_dir / f"{result.repo_name}_{timestamp}.md"
-        
-        if result.performance is None:
-            result.performance = PerformanceMetrics()
-            result.performance.calculate_from_results(result, result.search_times)
-        
-        if result.environment is None:
-            result.environment = TestEnvironment.capture_current()
-        
-        # Get baseline for comparison
-        baseline = result.performance._get_baseline_for_size(result.chunks_extracted)
-        
-        with open(report_file, 'w') as f:
-            f.write(f"""# Performance Benchmark Report: {result.repo_name}
+    def memory_growth_mb_per_minute(self) -> Optional[float]:
+        """Estimate the memory growth rate with a linear fit over the sample window."""
+        samples = np.array(list(self.samples), dtype=np.float64)
+        if len(samples) < 2:
+            return None
+        slope, _ = np.polyfit(samples[:, 0] - samples[0, 0], samples[:, 1], 1)
+        return float(slope) * 60
+
+_INDIVIDUAL_REPORT_TEMPLATE = """# Performance Benchmark Report: {result.repo_name}
 
 **Repository:** {result.repo_url}  
-**Test Date:** {result.start_time.strftime('%Y-%m-%d %H:%M:%S')}  
+**Test Date:** {test_date}  
 **Duration:** {result.total_time:.2f} seconds  
 **Success Rate:** {result.success_rate:.1f}%  
-**Dataset Category:** {baseline.size_category if baseline else 'Unknown'}
+**Dataset Category:** {size_category}
 
 ## Executive Summary
 
@@ -608,30 +557,30 @@ This report provides comprehensive performance benchmarks for the {result.repo_n
 
 | Metric | Value | Unit | Baseline Comparison |
 |--------|-------|------|-------------------|
-| **Dataset Size** | {result.chunks_extracted:,} | code chunks | {baseline.size_category if baseline else 'N/A'} category |
+| **Dataset Size** | {chunks_extracted} | code chunks | {size_category} category |
 | **Files Processed** | {result.files_processed:,} | files | - |
-| **Ingestion Rate** | {result.performance.ingestion_rate_chunks_per_second:.1f} | chunks/second | {self._format_baseline_comparison(result.performance.ingestion_rate_chunks_per_second, baseline.expected_ingestion_rate if baseline else None)} |
-| **Search Latency (Avg)** | {result.performance.search_latency_avg_ms:.1f} | milliseconds | {self._format_baseline_comparison(result.performance.search_latency_avg_ms, baseline.expected_search_latency if baseline else None)} |
-| **Memory Efficiency** | {result.performance.memory_efficiency_mb_per_1k_chunks:.1f} | MB per 1K chunks | - |
-| **Throughput** | {result.performance.throughput_queries_per_second:.2f} | queries/second | - |
-| **Performance vs Baseline** | {result.performance.relative_performance_vs_baseline:.1f}% | relative | {'Above' if result.performance.relative_performance_vs_baseline > 100 else 'Below'} expected |
-| **Stability Index** | {result.performance.performance_stability_index:.1f} | consistency score | {'Stable' if result.performance.performance_stability_index < 20 else 'Variable'} |
+| **Ingestion Rate** | {ingestion_rate} | chunks/second | {ingestion_rate_vs_baseline} |
+| **Search Latency (Avg)** | {latency_avg} | milliseconds | {search_latency_vs_baseline} |
+| **Memory Efficiency** | {memory_efficiency} | MB per 1K chunks | - |
+| **Throughput** | {throughput} | queries/second | - |
+| **Performance vs Baseline** | {relative_performance}% | relative | {relative_performance_category} expected |
+| **Stability Index** | {stability_index} | consistency score | {stability_category} |
 
 ## Test Environment
 
 ### Hardware Specifications
-- **Platform:** {result.environment.platform}
-- **CPU Cores:** {result.environment.cpu_count}
-- **Total Memory:** {result.environment.total_memory_gb:.1f} GB
-- **Available Memory:** {result.environment.available_memory_gb:.1f} GB
-- **Disk Space:** {result.environment.disk_space_gb:.1f} GB
+- **Platform:** {env.platform}
+- **CPU Cores:** {env.cpu_count}
+- **Total Memory:** {env.total_memory_gb:.1f} GB
+- **Available Memory:** {env.available_memory_gb:.1f} GB
+- **Disk Space:** {env.disk_space_gb:.1f} GB
 
 ### Software Environment
-- **Python Version:** {result.environment.python_version}
-- **MindsDB Version:** {result.environment.mindsdb_version}
-- **Embedding Model:** {result.environment.openai_model_embedding}
-- **Reranking Model:** {result.environment.openai_model_reranking}
-- **Test Timestamp:** {result.environment.timestamp}
+- **Python Version:** {env.python_version}
+- **MindsDB Version:** {env.mindsdb_version}
+- **Embedding Model:** {env.openai_model_embedding}
+- **Reranking Model:** {env.openai_model_reranking}
+- **Test Timestamp:** {env.timestamp}
 
 ## Repository Characteristics
 
@@ -640,23 +589,11 @@ This report provides comprehensive performance benchmarks for the {result.repo_n
 - **Primary Language:** {repo.language}
 - **Estimated Files:** {repo.estimated_files}
 - **Actual Files Processed:** {result.files_processed}
-- **Code Chunks Extracted:** {result.chunks_extracted:,}
+- **Code Chunks Extracted:** {chunks_extracted}
 - **Batch Size Used:** {result.batch_size}
 
 ### Language Distribution
-""")
-            
-            if result.language_breakdown:
-                f.write("| Language | Chunks | Percentage |\n")
-                f.write("|----------|--------|------------|\n")
-                total_chunks = sum(result.language_breakdown.values())
-                for lang, count in sorted(result.language_breakdown.items(), key=lambda x: x[1], reverse=True):
-                    percentage = (count / total_chunks) * 100 if total_chunks > 0 else 0
-                    f.write(f"| {lang} | {count:,} | {percentage:.1f}% |\n")
-            else:
-                f.write("Language breakdown not available.\n")
-            
-            f.write(f"""
+{language_distribution}
 
 ## Performance Benchmarks
 
@@ -664,42 +601,42 @@ This report provides comprehensive performance benchmarks for the {result.repo_n
 
 | Metric | Value | Benchmark Category | Statistical Significance |
 |--------|-------|-------------------|-------------------------|
-| **Total Ingestion Time** | {result.ingestion_time:.2f} seconds | {self._categorize_ingestion_time(result.ingestion_time)} | - |
-| **Chunks per Second** | {result.performance.ingestion_rate_chunks_per_second:.1f} | {self._categorize_ingestion_rate(result.performance.ingestion_rate_chunks_per_second)} | {result.performance.relative_performance_vs_baseline:.1f}% vs baseline |
-| **Files per Second** | {result.performance.ingestion_rate_files_per_second:.1f} | {self._categorize_file_rate(result.performance.ingestion_rate_files_per_second)} | - |
-| **Time per 1K Chunks** | {result.performance.ingestion_time_per_1k_chunks:.1f} seconds | {self._categorize_chunk_time(result.performance.ingestion_time_per_1k_chunks)} | - |
-| **Consistency Score** | {result.performance.ingestion_consistency_score:.1f} | {'Stable' if result.performance.ingestion_consistency_score < 10 else 'Variable'} | Lower is better |
-| **Scalability Factor** | {result.performance.scalability_factor:.2f} | {'Linear' if 0.8 <= result.performance.scalability_factor <= 1.2 else 'Non-linear'} | 1.0 = perfect scaling |
+| **Total Ingestion Time** | {ingestion_time} seconds | {ingestion_time_category} | - |
+| **Chunks per Second** | {ingestion_rate} | {ingestion_rate_category} | {relative_performance}% vs baseline |
+| **Files per Second** | {perf.ingestion_rate_files_per_second:.1f} | {file_rate_category} | - |
+| **Time per 1K Chunks** | {perf.ingestion_time_per_1k_chunks:.1f} seconds | {chunk_time_category} | - |
+| **Consistency Score** | {perf.ingestion_consistency_score:.1f} | {consistency_category} | Lower is better |
+| **Scalability Factor** | {perf.scalability_factor:.2f} | {scalability_category} | 1.0 = perfect scaling |
 
 ### Search Performance with Statistical Analysis
 
 | Metric | Value | Benchmark Category | 95% Confidence Interval |
 |--------|-------|-------------------|------------------------|
-| **Average Latency** | {result.performance.search_latency_avg_ms:.1f} ms | {self._categorize_latency(result.performance.search_latency_avg_ms)} | {f"({result.performance.search_latency_stats.confidence_interval_95[0]:.1f}, {result.performance.search_latency_stats.confidence_interval_95[1]:.1f}) ms" if result.performance.search_latency_stats else "N/A"} |
-| **Median Latency** | {result.performance.search_latency_stats.median:.1f if result.performance.search_latency_stats else 0:.1f} ms | - | More robust than mean |
-| **95th Percentile** | {result.performance.search_latency_p95_ms:.1f} ms | {self._categorize_latency(result.performance.search_latency_p95_ms)} | - |
-| **99th Percentile** | {result.performance.search_latency_p99_ms:.1f} ms | {self._categorize_latency(result.performance.search_latency_p99_ms)} | - |
-| **Standard Deviation** | {result.performance.search_latency_stats.std_dev:.1f if result.performance.search_latency_stats else 0:.1f} ms | - | Consistency measure |
-| **Coefficient of Variation** | {result.performance.search_latency_stats.coefficient_variation:.1f if result.performance.search_latency_stats else 0:.1f}% | {'Consistent' if (result.performance.search_latency_stats.coefficient_variation if result.performance.search_latency_stats else 0) < 20 else 'Variable'} | <20% is good |
-| **Queries per Second** | {result.performance.throughput_queries_per_second:.2f} | {self._categorize_throughput(result.performance.throughput_queries_per_second)} | - |
+| **Average Latency** | {latency_avg} ms | {avg_latency_category} | {latency_ci} |
+| **Median Latency** | {latency_median} ms | - | More robust than mean |
+| **95th Percentile** | {perf.search_latency_p95_ms:.1f} ms | {p95_latency_category} | - |
+| **99th Percentile** | {perf.search_latency_p99_ms:.1f} ms | {p99_latency_category} | - |
+| **Standard Deviation** | {latency_std_dev} ms | - | Consistency measure |
+| **Coefficient of Variation** | {latency_cv}% | {latency_cv_category} | <20% is good |
+| **Queries per Second** | {throughput} | {throughput_category} | - |
 
 ### Memory and Resource Efficiency
 
 | Metric | Value | Benchmark Category | Efficiency Analysis |
 |--------|-------|-------------------|-------------------|
-| **Peak Memory Usage** | {result.peak_memory_mb:.1f} MB | {self._categorize_memory(result.peak_memory_mb)} | {self._compare_memory_to_baseline(result.peak_memory_mb, result.chunks_extracted)} |
-| **Memory per 1K Chunks** | {result.performance.memory_efficiency_mb_per_1k_chunks:.1f} MB | {self._categorize_memory_efficiency(result.performance.memory_efficiency_mb_per_1k_chunks)} | - |
-| **Memory Growth Rate** | {result.performance.memory_growth_rate:.2f} MB/1K chunks | {'Linear' if result.performance.memory_growth_rate < 50 else 'Concerning'} | Scalability indicator |
-| **CPU Usage Peak** | {result.cpu_usage_percent:.1f}% | {self._categorize_cpu(result.cpu_usage_percent)} | - |
-| **Efficiency Ratio** | {result.performance.efficiency_ratio:.2f} results/MB | {'Efficient' if result.performance.efficiency_ratio > 1 else 'Inefficient'} | Higher is better |
+| **Peak Memory Usage** | {memory_peak} MB | {memory_category} | {memory_vs_baseline} |
+| **Memory per 1K Chunks** | {memory_efficiency} MB | {memory_efficiency_category} | - |
+| **Memory Growth Rate** | {perf.memory_growth_rate:.2f} MB/1K chunks | {memory_growth_category} | Scalability indicator |
+| **CPU Usage Peak** | {result.cpu_usage_percent:.1f}% | {cpu_category} | - |
+| **Efficiency Ratio** | {perf.efficiency_ratio:.2f} results/MB | {efficiency_category} | Higher is better |
 
 ### Advanced Performance Analysis
 
 | Metric | Value | Interpretation |
 |--------|-------|----------------|
-| **Performance Stability Index** | {result.performance.performance_stability_index:.1f} | {'Stable performance' if result.performance.performance_stability_index < 20 else 'Variable performance - investigate'} |
-| **Outlier Detection** | {result.performance.search_latency_stats.outliers_count if result.performance.search_latency_stats else 0} outliers | {'Normal distribution' if (result.performance.search_latency_stats.outliers_count if result.performance.search_latency_stats else 0) < 2 else 'Some queries had unusual latency'} |
-| **Min/Max Latency Range** | {result.performance.search_latency_stats.min_value:.1f} - {result.performance.search_latency_stats.max_value:.1f} ms | {'Consistent' if (result.performance.search_latency_stats.max_value - result.performance.search_latency_stats.min_value if result.performance.search_latency_stats else 0) < 1000 else 'High variance'} |
+| **Performance Stability Index** | {stability_index} | {stability_interpretation} |
+| **Outlier Detection** | {latency_outliers} outliers | {outlier_interpretation} |
+| **Min/Max Latency Range** | {latency_min} - {latency_max} ms | {latency_range_interpretation} |
 
 ## Detailed Test Results
 
@@ -707,37 +644,80 @@ This report provides comprehensive performance benchmarks for the {result.repo_n
 
 | Step | Status | Duration | Notes |
 |------|--------|----------|-------|
-| **KB Creation** | {'✓ Success' if result.kb_creation_success else '✗ Failed'} | {result.kb_creation_time:.2f}s | {result.kb_creation_error or 'Completed successfully'} |
-| **Data Ingestion** | {'✓ Success' if result.ingestion_success else '✗ Failed'} | {result.ingestion_time:.2f}s | {result.ingestion_error or 'Completed successfully'} |
-| **Index Creation** | {'✓ Success' if result.indexing_success else '✗ Failed'} | {result.indexing_time:.2f}s | {result.indexing_error or 'Completed successfully'} |
-| **Semantic Search** | {'✓ Success' if result.search_success else '✗ Failed'} | {result.search_time:.2f}s | {result.search_error or 'Completed successfully'} |
-| **AI Analysis** | {'✓ Success' if result.ai_analysis_success else '✗ Failed'} | {result.ai_analysis_time:.2f}s | {result.ai_analysis_error or 'Completed successfully'} |
+| **KB Creation** | {kb_creation_status} | {result.kb_creation_time:.2f}s | {kb_creation_notes} |
+| **Data Ingestion** | {ingestion_status} | {ingestion_time}s | {ingestion_notes} |
+| **Index Creation** | {indexing_status} | {result.indexing_time:.2f}s | {indexing_notes} |
+| **Semantic Search** | {search_status} | {result.search_time:.2f}s | {search_notes} |
+| **AI Analysis** | {ai_analysis_status} | {result.ai_analysis_time:.2f}s | {ai_analysis_notes} |
 
 ### Search Query Performance
-""")
-            
-            if result.search_times:
-                f.write("| Query # | Response Time (ms) | Status |\n")
-                f.write("|---------|-------------------|--------|\n")
-                for i, time_val in enumerate(result.search_times, 1):
-                    status = "✓ Fast" if time_val * 1000 < 1000 else "⚠ Slow" if time_val * 1000 < 3000 else "✗ Very Slow"
-                    f.write(f"| {i} | {time_val * 1000:.1f} | {status} |\n")
-            else:
-                f.write("Individual query times not recorded.\n")
-            
-            f.write(f"""
+{query_performance}
+
+{static_sections}| **Ingestion Rate** | {expected_ingestion_range} chunks/sec | {ingestion_rate} | {ingestion_range_status} |
+| **Search Latency** | < 2000 ms | {latency_avg} ms | {latency_baseline_status} |
+| **Memory Usage** | {expected_memory_range} MB | {memory_peak} MB | {memory_vs_baseline} |
+
+## Critical Optimization Insights
+
+### Performance Bottleneck Analysis
+
+Based on the benchmark results, here are the critical insights for optimization:
+
+{critical_insights}
+### Statistical Confidence and Reliability
 
-## Reproducibility Information
+- **Sample Size**: {result.queries_tested} search queries tested
+- **Confidence Level**: 95% confidence intervals provided for latency measurements
+- **Statistical Significance**: {statistical_significance}
+- **Outlier Impact**: {latency_outliers} outliers detected out of {result.queries_tested} queries
+- **Reproducibility Score**: {reproducibility_score} (based on consistency metrics)
+
+### Comparative Performance Analysis
+
+{comparative_analysis}
+
+## Recommendations
+
+### Critical Performance Optimizations
+{recommendations}
+
+### Scaling Considerations and Resource Planning
+
+For repositories of similar size ({chunks_extracted} chunks):
+
+| Resource | Recommendation | Justification |
+|----------|----------------|---------------|
+| **Batch Size** | {recommended_batch_size} | Optimized for {baseline_size_category} dataset size |
+| **Memory Requirements** | {recommended_memory} GB minimum | Based on {perf.memory_growth_rate:.1f} MB/1K chunks growth rate |
+| **Expected Duration** | {estimated_duration} minutes | Linear scaling from current performance |
+| **Concurrent Queries** | {recommended_concurrency} | Based on latency and stability metrics |
+| **Hardware Specs** | {recommended_hardware} | Optimized for this workload pattern |
+
+### Cost-Performance Analysis
+
+- **Processing Cost**: ~{processing_cost:.2f} USD (estimated OpenAI API costs)
+- **Time Cost**: {time_cost_minutes:.1f} minutes total processing time
+- **Efficiency Rating**: {efficiency_rating}
+- **ROI Optimization**: {roi_optimization}
+
+---
+
+**Report Generated:** {generated_at}  
+**Tool Version:** Semantic Code Navigator v1.0  
+**Report Format:** Individual Repository Benchmark v1.0  
+"""
+
+_STATIC_SECTIONS_TEMPLATE = """## Reproducibility Information
 
 ### Test Methodology
 
 This benchmark follows a standardized methodology for reproducible results:
 
 1. **Environment Setup**: Fresh MindsDB instance with clean knowledge base
-2. **Repository Cloning**: Clone from {result.repo_url} using detected default branch
-3. **Code Extraction**: AST-based parsing for {repo.language} files with metadata extraction
-4. **Batch Processing**: Insert {result.batch_size} chunks per batch for optimal performance
-5. **Search Testing**: Execute {result.queries_tested} semantic queries with natural language
+2. **Repository Cloning**: Clone from {repo_url} using detected default branch
+3. **Code Extraction**: AST-based parsing for {language} files with metadata extraction
+4. **Batch Processing**: Insert {batch_size} chunks per batch for optimal performance
+5. **Search Testing**: Execute {queries_tested} semantic queries with natural language
 6. **AI Enhancement**: Test AI-powered code analysis and explanation features
 7. **Cleanup**: Reset knowledge base to ensure isolated test environment
 
@@ -751,7 +731,7 @@ export OPENAI_API_KEY="your-api-key"
 # Run benchmark
 python -m src.cli kb:reset --force
 python -m src.cli kb:init
-python -m src.cli kb:ingest {result.repo_url} --batch-size {result.batch_size} --extract-git-info
+python -m src.cli kb:ingest {repo_url} --batch-size {batch_size} --extract-git-info
 python -m src.cli kb:query "authentication and login validation" --limit 3
 python -m src.cli ai:init --force
 python -m src.cli kb:query "authentication and login validation" --limit 2 --ai-all
@@ -759,97 +739,818 @@ python -m src.cli kb:query "authentication and login validation" --limit 2 --ai-
 
 ### Performance Baselines
 
-Based on repository size category ({self._get_size_category(result.chunks_extracted)}):
+Based on repository size category ({size_category}):
 
 | Metric | Expected Range | Actual Result | Status |
 |--------|----------------|---------------|--------|
-| **Ingestion Rate** | {self._get_expected_ingestion_range(result.chunks_extracted)} chunks/sec | {result.performance.ingestion_rate_chunks_per_second:.1f} | {self._compare_to_baseline(result.performance.ingestion_rate_chunks_per_second, self._get_expected_ingestion_range(result.chunks_extracted))} |
-| **Search Latency** | < 2000 ms | {result.performance.search_latency_avg_ms:.1f} ms | {self._compare_latency_to_baseline(result.performance.search_latency_avg_ms)} |
-| **Memory Usage** | {self._get_expected_memory_range(result.chunks_extracted)} MB | {result.peak_memory_mb:.1f} MB | {self._compare_memory_to_baseline(result.peak_memory_mb, result.chunks_extracted)} |
+"""
 
-## Critical Optimization Insights
+@lru_cache(maxsize=128)
+def _static_report_sections(size_category: str, batch_size: int, language: str, repo_url: str, queries_tested: int) -> str:
+    """Render the methodology, reproduction script and baseline table header of an individual report.
+    
+    These sections only depend on the repository configuration, so repeated runs
+    against similar repositories reuse the rendered text.
+    """
+    return _STATIC_SECTIONS_TEMPLATE.format(
+        size_category=size_category,
+        batch_size=batch_size,
+        language=language,
+        repo_url=repo_url,
+        queries_tested=queries_tested
+    )
+
+_FINAL_SUMMARY_TEMPLATE = """
+## Comprehensive Performance Benchmark Summary
 
-### Performance Bottleneck Analysis
+**Test Suite Completed:** {completed_at}  
+**Total Duration:** {duration_hours:.2f} hours  
+**Total Dataset Size:** {total_chunks_extracted:,} code chunks across {repo_count} repositories
 
-Based on the benchmark results, here are the critical insights for optimization:
+### Executive Performance Summary
+
+| Metric | Value | 95% Confidence Interval | Statistical Significance |
+|--------|-------|------------------------|------------------------|
+| **Total Repositories Tested** | {repo_count} | - | Complete test matrix |
+| **Success Rate** | {success_pct:.1f}% | - | {successful_count}/{repo_count} repositories |
+| **Total Files Processed** | {total_files_processed:,} | - | Across all repositories |
+| **Total Code Chunks** | {total_chunks_extracted:,} | - | Embedded and indexed |
+| **Average Ingestion Rate** | {rate_stats.mean:.1f} chunks/sec | ({rate_stats.confidence_interval_95[0]:.1f}, {rate_stats.confidence_interval_95[1]:.1f}) | CV: {rate_stats.coefficient_variation:.1f}% |
+| **Average Search Latency** | {latency_stats.mean:.1f} ms | ({latency_stats.confidence_interval_95[0]:.1f}, {latency_stats.confidence_interval_95[1]:.1f}) | CV: {latency_stats.coefficient_variation:.1f}% |
+| **Average Memory Usage** | {memory_stats.mean:.1f} MB | ({memory_stats.confidence_interval_95[0]:.1f}, {memory_stats.confidence_interval_95[1]:.1f}) | CV: {memory_stats.coefficient_variation:.1f}% |
+
+### Cross-Repository Performance Analysis
+
+#### Ingestion Performance Distribution
+
+| Statistic | Value | Interpretation |
+|-----------|-------|----------------|
+| **Median Ingestion Rate** | {rate_stats.median:.1f} chunks/sec | More robust than mean |
+| **Performance Range** | {rate_stats.min_value:.1f} - {rate_stats.max_value:.1f} chunks/sec | {rate_spread:.1f}x variation |
+| **Standard Deviation** | {rate_stats.std_dev:.1f} chunks/sec | Consistency measure |
+| **Outlier Repositories** | {rate_stats.outliers_count} | Repositories with unusual performance |
+| **Performance Consistency** | {rate_stats.coefficient_variation:.1f}% CV | {rate_consistency} across repositories |
+
+#### Search Latency Analysis
+
+| Statistic | Value | Interpretation |
+|-----------|-------|----------------|
+| **Median Latency** | {latency_stats.median:.1f} ms | Typical user experience |
+| **Latency Range** | {latency_stats.min_value:.1f} - {latency_stats.max_value:.1f} ms | {latency_spread:.1f}x variation |
+| **95% of Queries Under** | {query_latency_stats.p95:.1f} ms | SLA recommendation |
+| **Latency Consistency** | {latency_stats.coefficient_variation:.1f}% CV | {latency_predictability} performance |
+
+#### Memory Efficiency Patterns
+
+| Statistic | Value | Interpretation |
+|-----------|-------|----------------|
+| **Median Memory Usage** | {memory_stats.median:.1f} MB | Typical requirement |
+| **Memory Range** | {memory_stats.min_value:.1f} - {memory_stats.max_value:.1f} MB | {memory_spread:.1f}x scaling factor |
+| **Memory Predictability** | {memory_stats.coefficient_variation:.1f}% CV | {memory_predictability} scaling |
+
+### Performance Analysis
+
+#### Ingestion Performance by Repository Size
+
+| Repository | Files | Chunks | Batch Size | Ingestion Time | Chunks/Second |
+|------------|-------|--------|------------|----------------|---------------|
+"""
+
+# Table rows are rendered from plain tuples, one positional field per column
+_INGESTION_ROW_TEMPLATE = "| {} | {} | {} | {} | {:.2f}s | {:.1f} |\n"
+
+_SEARCH_TABLE_HEADER = """
+#### Search Performance Analysis
+
+| Repository | Queries Tested | Avg Response Time | Total Results | Results/Query |
+|------------|----------------|-------------------|---------------|---------------|
+"""
+
+_SEARCH_ROW_TEMPLATE = "| {} | {} | {:.2f}s | {} | {:.1f} |\n"
+
+_FAILURE_HEADER = """
+### Failure Analysis
+
+#### Failed Tests
+"""
+
+_FAILED_TEST_TEMPLATE = """
+**{r.repo_name}** (Success Rate: {r.success_rate:.1f}%)
+"""
+
+# (TestResult attribute, label) pairs listed under each failed test, in report order
+_FAILURE_FIELDS = (
+    ('kb_creation_error', 'KB Creation Error'),
+    ('ingestion_error', 'Ingestion Error'),
+    ('indexing_error', 'Indexing Error'),
+    ('search_error', 'Search Error'),
+    ('ai_analysis_error', 'AI Analysis Error'),
+)
+
+_INSIGHTS_TEMPLATE = """
+### Critical Performance Insights and Optimization Recommendations
+
+#### Statistical Significance and Confidence
+
+- **Sample Size**: {repo_count} repositories tested with {total_chunks_extracted:,} total code chunks
+- **Statistical Power**: 95% confidence intervals provided for all key metrics
+- **Data Quality**: {successful_count}/{repo_count} successful tests provide robust statistical foundation
+- **Variance Analysis**: Performance consistency varies by repository size and complexity
+
+#### Key Performance Bottlenecks Identified
+
+"""
+
+_BOTTLENECK_TEMPLATE = "**{category}**: {description}\n\n"
+
+_PATTERNS_HEADER = """
+
+#### Cross-Repository Performance Patterns
+
+"""
+
+_SIZE_ANALYSIS_TEMPLATE = """**{size_cat} Repositories** ({count} tested):
+- Average ingestion rate: {avg_ingestion_rate:.1f} chunks/sec
+- Average search latency: {avg_search_latency:.1f} ms
+- Memory efficiency: {avg_memory_efficiency:.1f} MB per 1K chunks
+- Performance consistency: {consistency_rating}
+
+"""
+
+_IMMEDIATE_RECS_HEADER = """
+
+#### Optimization Recommendations by Priority
+
+**Immediate Actions (High Impact)**:
+"""
+
+_SCALING_RECS_HEADER = """
+
+**Scaling Optimizations (Medium-Long Term)**:
+"""
+
+_RELIABILITY_RECS_HEADER = """
+
+**Reliability and Monitoring**:
+"""
+
+_RECOMMENDATION_TEMPLATE = "- {}\n"
+
+_COST_PERFORMANCE_TEMPLATE = """
+
+#### Cost-Performance Analysis
+
+- **Total Estimated Processing Cost**: ${total_cost:.2f} for complete test suite
+- **Average Cost per Repository**: ${avg_cost:.2f}
+- **Cost per 1K Chunks**: ${cost_per_1k_chunks:.3f}
+- **Time Efficiency**: {chunks_per_hour:.0f} chunks processed per hour
+- **Resource Efficiency**: {chunks_per_mb:.2f} chunks per MB memory
+
+#### Performance Baselines for Future Testing
+
+Based on this comprehensive analysis, the following performance baselines are recommended:
+
+| Repository Size | Expected Ingestion Rate | Expected Search Latency | Expected Memory Usage |
+|----------------|------------------------|------------------------|---------------------|
+"""
+
+_BASELINE_ROW_TEMPLATE = "| {size} | {ingestion_rate} chunks/sec | {search_latency} ms | {memory_usage} MB |\n"
+
+_METHODOLOGY_TEMPLATE = """
+
+#### Reproducibility and Methodology
+
+**Test Environment Consistency**: All tests run on standardized environment with documented specifications
+**Statistical Methodology**: 95% confidence intervals, outlier detection, coefficient of variation analysis
+**Reproducibility Score**: High - all individual reports contain exact reproduction commands
+**Baseline Validation**: Performance baselines derived from {repo_count} repository statistical analysis
+
+### Test Environment
+- **Python Version:** {python_version}
+- **Test Machine:** {system} {release}
+- **Available Memory:** {memory_gb:.1f} GB
+- **CPU Cores:** {cpu_count}
+
+### Individual Repository Reports
+
+Detailed benchmark reports for each repository have been generated in the `results/` directory:
+
+"""
+
+_REPORT_LINK_TEMPLATE = "- **{name}**: `results/{name}_{timestamp}.md` (JSON: `{name}_{timestamp}.json`)\n"
+
+_FINAL_FOOTER = """
+
+Each individual report contains:
+- Complete environment specifications for reproducibility
+- Detailed performance metrics with benchmark categories
+- Language breakdown and repository characteristics  
+- Step-by-step execution results with timing
+- Performance baselines and recommendations
+- Reproduction scripts for exact replication
+
+---
+
+*Report generated by Semantic Code Navigator Stress Test Suite*
+"""
+
+class StressTestSuite:
+    """Main stress testing suite."""
+    
+    def __init__(self, max_parallel_repos: int = 1):
+        self.results: List[TestResult] = []
+        self._total_cost = 0.0
+        self._total_chunks_extracted = 0
+        self._total_files_processed = 0
+        self._max_memory_mb = 0.0
+        self._metrics = ResultsFrame()
+        self.max_parallel_repos = max(1, max_parallel_repos)
+        self._report_lock = threading.Lock()
+        self._ai_tables_lock = threading.Lock()
+        self._mindsdb_semaphore = threading.Semaphore(_MAX_CONCURRENT_MINDSDB_CALLS)
+        self._cmd_cache: "OrderedDict[Tuple[str, Optional[int]], Tuple[bool, str, float, float]]" = OrderedDict()
+        self._cmd_cache_lock = threading.Lock()
+        self._optimal_batch_by_size_category: Dict[str, int] = {}
+        self._best_throughput_by_size_category: Dict[str, Tuple[float, int]] = {}
+        self._batch_tuning_lock = threading.Lock()
+        self._backoff_state: Dict[str, int] = {}
+        self._resource_sampler = _ResourceSampler()
+        self._report_buffer: List[str] = []
+        self._report_flush_threshold = 64
+        self._report_flush_interval = 2.0
+        self._report_flush_timer: Optional[threading.Timer] = None
+        self._report_fh = None
+        atexit.register(self._close_report)
+        self.start_time = datetime.now()
+        self.report_file = f"stress_test_report_{self.start_time.strftime('%Y%m%d_%H%M%S')}.md"
+        self.cli_path = "python -m src.cli"
+        self._cli_argv = [sys.executable, "-m", "src.cli"]
+        self.results_dir = Path("results")
+        self.results_dir.mkdir(exist_ok=True)
+        
+        self.test_repositories = [
+            # Small repositories (30-80 files) - Quick tests
+            TestRepository("flask-microblog", "https://github.com/miguelgrinberg/microblog", 50, "Python", "Flask microblog tutorial", 100, 10),
+            TestRepository("calculator", "https://github.com/Abdulvoris101/Vue-Calculator", 40, "JavaScript", "Express.js web framework", 80, 12),
+            TestRepository("vue-calculator", "https://github.com/ahfarmer/calculator", 35, "JavaScript", "Simple calculator app", 70, 10),
+            TestRepository("todo", "https://github.com/tusharnankani/ToDoList", 80, "JavaScript", "TodoMVC React implementation", 160, 16),
+            TestRepository("react-weather-app", "https://github.com/Adedoyin-Emmanuel/react-weather-app", 60, "JavaScript", "React app generator", 120, 15),
+            
+            # Medium repositories (80-150 files) - Moderate tests  
+            TestRepository("fastapi-example", "https://github.com/tiangolo/full-stack-fastapi-postgresql", 90, "Python", "FastAPI full-stack example", 180, 18),
+            TestRepository("gin-rest-api", "https://github.com/gin-gonic/gin", 120, "Go", "Gin REST API example", 240, 20),
+            TestRepository("vue-cli", "https://github.com/vuejs/vue-cli", 100, "JavaScript", "Vue.js CLI tool", 200, 18),
+        ]
+        
+        self.search_queries = [
+            "authentication and login validation",
+            "database connection and queries",
+            "error handling and logging",
+            "API endpoint routing",
+            "data validation and sanitization",
+            "file upload and processing",
+            "caching and performance optimization",
+            "security and authorization",
+            "testing and unit tests",
+            "configuration and environment setup"
+        ]
+        
+        # Recent latencies per query, used to favour cheaper queries when sampling
+        self._query_cost: Dict[str, deque] = {query: deque(maxlen=_QUERY_COST_WINDOW) for query in self.search_queries}
+        self._query_rng = random.Random(_QUERY_SAMPLE_SEED)
+        self._query_lock = threading.Lock()
+        
+        self.ai_analysis_types = [
+            "--classify",
+            "--explain", 
+            "--docstring",
+            "--tests",
+            "--all"
+        ]
+    
+    def initialize_report(self):
+        """Initialize the markdown report file and keep it open for incremental updates."""
+        with self._report_lock:
+            if self._report_fh is not None:
+                self._report_fh.close()
+            self._report_fh = f = open(self.report_file, 'w', encoding='utf-8', buffering=1 << 16)
+            f.write(f"""# Semantic Code Navigator - Comprehensive Stress Test Report
+
+**Test Suite Started:** {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}
+
+## Test Overview
 
+This comprehensive stress test evaluates the complete workflow of the Semantic Code Navigator:
+
+1. **Knowledge Base Creation** - Initialize MindsDB KB with embedding models
+2. **Data Ingestion** - Clone repositories and extract code chunks  
+3. **Index Creation** - Optimize KB for search performance
+4. **Semantic Search** - Query with natural language and metadata filters
+5. **AI Analysis** - Enhance results with AI tables for classification and explanation
+
+### Test Repositories
+
+Testing on **{len(self.test_repositories)}** repositories ranging from ~50 to 3000+ files:
+
+| Repository | Est. Files | Language | Batch Size | Max Queries | Description |
+|------------|------------|----------|------------|-------------|-------------|
 """)
             
-            # Generate critical insights
-            critical_insights = self._generate_critical_insights(result, baseline)
-            for insight in critical_insights:
-                f.write(f"**{insight['category']}**: {insight['description']}\n\n")
+            for repo in self.test_repositories:
+                f.write(f"| {repo.name} | {repo.estimated_files} | {repo.language} | {repo.batch_size} | {repo.max_concurrent_queries} | {repo.description} |\n")
+            
+            f.write(f"""
+### Test Parameters
+
+- **Search Queries:** {len(self.search_queries)} different semantic queries
+- **Batch Size Variation:** From 100 to 1000 based on repository size
+- **Test Execution:** {'Serial execution (one repository at a time)' if self.max_parallel_repos == 1 else f'Parallel execution (up to {self.max_parallel_repos} repositories at a time, isolated knowledge bases)'}
+- **Memory Management:** KB reset after each test to free memory
+- **Cost Optimization:** No AI summary generation to reduce OpenAI costs
+- **Individual Reports:** Detailed benchmark reports saved to `results/` directory
+- **Performance Metrics:** P95/P99 latency, throughput, memory efficiency tracking
+
+---
+
+## Test Results
+
+""")
+            f.flush()
+    
+    def _escape_markdown(self, text: str) -> str:
+        """Escape special markdown characters to prevent formatting issues."""
+        if not text:
+            return text
+        
+        # Escape common markdown special characters that could break formatting
+        escape_chars = ['*', '_', '`', '#', '[', ']', '(', ')', '|', '\\']
+        for char in escape_chars:
+            text = text.replace(char, f'\\{char}')
+        
+        return text
+
+    def update_report(self, message: str, level: str = "info"):
+        """Update the report with real-time information and appropriate status indicators.
+        
+        Queues timestamped messages with level-specific indicators for tracking test
+        progress and results. Queued messages are appended to the markdown report file
+        in batches, at the latest _report_flush_interval seconds after being queued;
+        see _flush_report.
+        """
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        
+        # Escape markdown special characters to prevent formatting issues
+        safe_message = self._escape_markdown(message)
+        
+        level_indicators = {
+            "info": "[INFO]",
+            "success": "[SUCCESS]", 
+            "warning": "[WARNING]",
+            "error": "[ERROR]",
+            "start": "[START]",
+            "finish": "[COMPLETE]"
+        }
+        
+        with self._report_lock:
+            self._report_buffer.append(f"\n**{timestamp}** {level_indicators.get(level, '[INFO]')} {safe_message}\n")
+            pending = len(self._report_buffer)
+            
+            if self._report_flush_timer is None:
+                self._report_flush_timer = threading.Timer(self._report_flush_interval, self._flush_report)
+                self._report_flush_timer.daemon = True
+                self._report_flush_timer.start()
+        
+        if pending >= self._report_flush_threshold:
+            self._flush_report()
+    
+    def _flush_report(self, tail: str = ""):
+        """Append all queued report messages, followed by ``tail``, to the report file in a single write.
+        
+        Writes go through the handle opened by initialize_report, so each flush only
+        emits the new text instead of reopening the file.
+        """
+        with self._report_lock:
+            if self._report_flush_timer is not None:
+                self._report_flush_timer.cancel()
+                self._report_flush_timer = None
+            
+            if tail:
+                self._report_buffer.append(tail)
+            if not self._report_buffer:
+                return
             
-            f.write(f"""
-### Statistical Confidence and Reliability
-
-- **Sample Size**: {result.queries_tested} search queries tested
-- **Confidence Level**: 95% confidence intervals provided for latency measurements
-- **Statistical Significance**: {f"Results are statistically significant with CV < 20%" if (result.performance.search_latency_stats.coefficient_variation if result.performance.search_latency_stats else 100) < 20 else "High variance detected - more samples recommended"}
-- **Outlier Impact**: {result.performance.search_latency_stats.outliers_count if result.performance.search_latency_stats else 0} outliers detected out of {result.queries_tested} queries
-- **Reproducibility Score**: {'High' if result.performance.performance_stability_index < 15 else 'Medium' if result.performance.performance_stability_index < 30 else 'Low'} (based on consistency metrics)
-
-### Comparative Performance Analysis
-
-""")
+            try:
+                if self._report_fh is None:
+                    self._report_fh = open(self.report_file, 'a', encoding='utf-8', buffering=1 << 16)
+                self._report_fh.write(''.join(self._report_buffer))
+                self._report_fh.flush()
+                self._report_buffer.clear()
+            except Exception as e:
+                console.print(f"Failed to update report: {e}", style="red")
+    
+    def _close_report(self):
+        """Flush queued report messages and close the report file handle."""
+        self._flush_report()
+        with self._report_lock:
+            if self._report_fh is not None:
+                self._report_fh.close()
+                self._report_fh = None
+    
+    def detect_repository_branch(self, repo_url: str) -> str:
+        """Detect the default branch of a repository (main vs master)."""
+        try:
+            console.print(f"Detecting branch for {repo_url}...", style="dim")
+            
+            result = subprocess.run(
+                ["git", "ls-remote", "--heads", repo_url],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            
+            if result.returncode == 0:
+                branches = result.stdout.strip()
+                if "refs/heads/main" in branches:
+                    console.print("Detected branch: main", style="dim")
+                    return "main"
+                elif "refs/heads/master" in branches:
+                    console.print("Detected branch: master", style="dim")
+                    return "master"
+                else:
+                    lines = branches.split('\n')
+                    for line in lines:
+                        if 'refs/heads/' in line:
+                            branch_name = line.split('refs/heads/')[-1]
+                            if branch_name in ['develop', 'dev', 'trunk']:
+                                console.print(f"Detected branch: {branch_name}", style="dim")
+                                return branch_name
+                    if lines and 'refs/heads/' in lines[0]:
+                        branch_name = lines[0].split('refs/heads/')[-1]
+                        console.print(f"Using first available branch: {branch_name}", style="dim")
+                        return branch_name
+            
+            console.print("Using default branch: main", style="dim")
+            return "main"
             
-            if baseline:
-                f.write(f"""
+        except Exception as e:
+            console.print(f"Branch detection failed for {repo_url}: {e}", style="yellow")
+            return "main"
+
+    def run_cli_command(self, command: str, timeout: int = 300, retries: int = 2,
+                        env: Optional[Dict[str, str]] = None) -> Tuple[bool, str, float]:
+        """Execute CLI command, reusing recent results of cacheable commands.
+        
+        Successful runs of commands in _CACHEABLE_COMMANDS that took longer than
+        _CMD_CACHE_MIN_SECONDS are kept for _CMD_CACHE_TTL seconds, keyed on the
+        command and its environment. A cached result reports an execution time of 0.0,
+        since nothing ran. Commands that change the underlying state drop the affected
+        entries of the same environment before they run. At most _MAX_CONCURRENT_MINDSDB_CALLS
+        commands run at once, not counting _UNTHROTTLED_COMMANDS; the wait for a slot is
+        not part of the execution time.
+        """
+        env_key = hash(frozenset(env.items())) if env else None
+        self._invalidate_cached_commands(command, env_key)
+        
+        cacheable = command in _CACHEABLE_COMMANDS
+        key = (command, env_key)
+        
+        if cacheable:
+            with self._cmd_cache_lock:
+                entry = self._cmd_cache.get(key)
+                if entry and time.time() - entry[3] < _CMD_CACHE_TTL:
+                    self._cmd_cache.move_to_end(key)
+                    console.print(f"Cached: [bold cyan]{self.cli_path} {command}[/bold cyan]", style="dim")
+                    return entry[0], entry[1], 0.0
+        
+        success, output, execution_time = self._execute_cli_command(command, timeout, retries, env)
+        
+        if cacheable and success and execution_time > _CMD_CACHE_MIN_SECONDS:
+            with self._cmd_cache_lock:
+                self._cmd_cache[key] = (success, output, execution_time, time.time())
+                self._cmd_cache.move_to_end(key)
+                while len(self._cmd_cache) > _CMD_CACHE_SIZE:
+                    self._cmd_cache.popitem(last=False)
+        
+        return success, output, execution_time
+    
+    def _invalidate_cached_commands(self, command: str, env_key: Optional[int] = None):
+        """Drop cached results of the environment that the given command may make stale."""
+        with self._cmd_cache_lock:
+            stale = [key for key in self._cmd_cache
+                     if key[1] == env_key and command.startswith(_CACHEABLE_COMMANDS[key[0]])]
+            for key in stale:
+                del self._cmd_cache[key]
+    
+    def _execute_cli_command(self, command: str, timeout: int = 300, retries: int = 2,
+                             env: Optional[Dict[str, str]] = None) -> Tuple[bool, str, float]:
+        """Execute CLI command with real-time output display and retry logic.
+        
+        Runs the specified CLI command and streams output in real-time to the console.
+        Implements retry logic for connection failures and provides detailed error reporting.
+        An optional environment overrides the inherited one, e.g. to target a dedicated KB.
+        
+        The command is tokenized up front and run with the current interpreter without
+        an intermediate shell, so a timed out command can be killed directly. Timeouts
+        are not retried: a killed command such as kb:ingest may have left partial state
+        behind, and rerunning it would only wait out the timeout again.
+        """
+        start_time = time.time()
+        waited = 0.0
+        slot = nullcontext() if command.startswith(_UNTHROTTLED_COMMANDS) else self._mindsdb_semaphore
+        
+        for attempt in range(retries + 1):
+            try:
+                full_command = f"{self.cli_path} {command}"
+                argv = self._cli_argv + shlex.split(command)
+                if attempt > 0:
+                    console.print(f"Retry {attempt}: [bold cyan]{full_command}[/bold cyan]", style="yellow")
+                else:
+                    console.print(f"Running: [bold cyan]{full_command}[/bold cyan]")
+                
+                # Only the run itself holds a MindsDB call slot, not the sleeps between attempts
+                wait_start = time.time()
+                with slot:
+                    waited += time.time() - wait_start
+                    process = subprocess.Popen(
+                        argv,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        text=True,
+                        bufsize=1,
+                        universal_newlines=True,
+                        env=env
+                    )
+                    
+                    # Reading stdout blocks, so enforce the timeout by killing the process
+                    timed_out = threading.Event()
+                    
+                    def kill_on_timeout(proc=process):
+                        timed_out.set()
+                        proc.kill()
+                    
+                    watchdog = threading.Timer(timeout, kill_on_timeout)
+                    watchdog.daemon = True
+                    watchdog.start()
+                    try:
+                        output_lines = []
+                        while True:
+                            output = process.stdout.readline()
+                            if output == '' and process.poll() is not None:
+                                break
+                            if output:
+                                print(output.rstrip())
+                                output_lines.append(output.strip())
+                        
+                        process.wait()
+                    finally:
+                        watchdog.cancel()
+                
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(argv, timeout)
+                execution_time = time.time() - start_time - waited
+                full_output = '\n'.join(output_lines)
+                
+                if process.returncode == 0:
+                    return True, full_output, execution_time
+                else:
+                    connection_errors = [
+                        "Connection aborted",
+                        "Remote end closed connection",
+                        "Connection refused",
+                        "Connection timed out",
+                        "Failed to connect"
+                    ]
+                    
+                    if attempt < retries and any(err in full_output for err in connection_errors):
+                        console.print(f"Connection issue detected, retrying in 5 seconds...", style="yellow")
+                        time.sleep(5)
+                        continue
+                    
+                    return False, full_output, execution_time
+                    
+            except subprocess.TimeoutExpired:
+                execution_time = time.time() - start_time - waited
+                return False, f"Command timed out after {timeout} seconds", execution_time
+            except Exception as e:
+                execution_time = time.time() - start_time - waited
+                if attempt < retries:
+                    console.print(f"Command failed with exception, retrying...", style="yellow")
+                    time.sleep(5)
+                    continue
+                return False, str(e), execution_time
+        
+        execution_time = time.time() - start_time - waited
+        return False, "All retry attempts failed", execution_time
+    
+    def _repository_env(self, repo: TestRepository) -> Optional[Dict[str, str]]:
+        """Get CLI environment for a repository test.
+        
+        Parallel runs give every repository its own knowledge base so that the
+        reset/ingest cycle of one test does not wipe the data of another.
+        """
+        if self.max_parallel_repos == 1:
+            return None
+        
+        kb_name = "codebase_kb_" + re.sub(r'\W', '_', repo.name).lower()
+        return {**os.environ, "KB_NAME": kb_name}
+    
+    def monitor_system_resources(self, result: TestResult):
+        """Monitor system resources during test execution.
+        
+        Reads the peaks sampled in the background since the test started, and only
+        queries psutil directly when no samples are available yet.
+        """
+        peak = self._resource_sampler.peak_since(result.start_time.timestamp())
+        if peak is not None:
+            result.peak_memory_mb = max(result.peak_memory_mb, peak[0])
+            result.cpu_usage_percent = max(result.cpu_usage_percent, peak[1])
+            return
+        
+        try:
+            process = psutil.Process()
+            result.peak_memory_mb = max(result.peak_memory_mb, process.memory_info().rss / 1024 / 1024)
+            result.cpu_usage_percent = max(result.cpu_usage_percent, process.cpu_percent())
+        except:
+            pass
+    
+    def generate_individual_report(self, result: TestResult, repo: TestRepository):
+        """Generate detailed individual repository benchmark report.
+        
+        Creates a comprehensive report for a single repository test including
+        environment specifications, performance metrics, statistical analysis,
+        and critical optimization insights for reproducible benchmarks.
+        """
+        timestamp = result.start_time.strftime('%Y%m%d_%H%M%S')
+        report_file = self.results_dir / f"{result.repo_name}_{timestamp}.md"
+        
+        if result.performance is None:
+            result.performance = PerformanceMetrics()
+            result.performance.calculate_from_results(result, result.search_times)
+        
+        if not result.size_category:
+            result.size_category = self._get_size_category(result.chunks_extracted)
+        
+        if result.environment is None:
+            result.environment = TestEnvironment.capture_current()
+        
+        # Get baseline for comparison
+        baseline = result.performance._get_baseline_for_size(result.chunks_extracted)
+        perf = result.performance
+        stats = perf.search_latency_stats
+        
+        # Values that may be unavailable are left out of the context and render as "N/A"
+        ctx = _SafeDict(
+            result=result,
+            perf=perf,
+            env=result.environment,
+            repo=repo,
+            test_date=result.start_time.strftime('%Y-%m-%d %H:%M:%S'),
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        )
+        
+        # Format values referenced in several sections once and reuse the strings
+        ctx.update(
+            chunks_extracted=f"{result.chunks_extracted:,}",
+            ingestion_time=f"{result.ingestion_time:.2f}",
+            ingestion_rate=f"{perf.ingestion_rate_chunks_per_second:.1f}",
+            relative_performance=f"{perf.relative_performance_vs_baseline:.1f}",
+            latency_avg=f"{perf.search_latency_avg_ms:.1f}",
+            throughput=f"{perf.throughput_queries_per_second:.2f}",
+            memory_peak=f"{result.peak_memory_mb:.1f}",
+            memory_efficiency=f"{perf.memory_efficiency_mb_per_1k_chunks:.1f}",
+            stability_index=f"{perf.performance_stability_index:.1f}",
+        )
+        expected_ingestion_range = self._get_expected_ingestion_range(result.chunks_extracted)
+        
+        if baseline:
+            ctx.update(
+                size_category=baseline.size_category,
+                baseline_size_category=baseline.size_category,
+            )
+        else:
+            ctx['baseline_size_category'] = 'this'
+        
+        if stats:
+            ctx.update(
+                latency_ci=f"({stats.confidence_interval_95[0]:.1f}, {stats.confidence_interval_95[1]:.1f}) ms",
+                latency_median=f"{stats.median:.1f}",
+                latency_std_dev=f"{stats.std_dev:.1f}",
+                latency_cv=f"{stats.coefficient_variation:.1f}",
+                latency_outliers=stats.outliers_count,
+                latency_min=f"{stats.min_value:.1f}",
+                latency_max=f"{stats.max_value:.1f}",
+            )
+        
+        latency_cv = stats.coefficient_variation if stats else 0
+        outliers_count = stats.outliers_count if stats else 0
+        latency_range = stats.max_value - stats.min_value if stats else 0
+        
+        ctx.update(
+            ingestion_rate_vs_baseline=self._format_baseline_comparison(perf.ingestion_rate_chunks_per_second, baseline.expected_ingestion_rate if baseline else None),
+            search_latency_vs_baseline=self._format_baseline_comparison(perf.search_latency_avg_ms, baseline.expected_search_latency if baseline else None),
+            relative_performance_category='Above' if perf.relative_performance_vs_baseline > 100 else 'Below',
+            stability_category='Stable' if perf.performance_stability_index < 20 else 'Variable',
+            ingestion_time_category=self._categorize_ingestion_time(result.ingestion_time),
+            ingestion_rate_category=self._categorize_ingestion_rate(perf.ingestion_rate_chunks_per_second),
+            file_rate_category=self._categorize_file_rate(perf.ingestion_rate_files_per_second),
+            chunk_time_category=self._categorize_chunk_time(perf.ingestion_time_per_1k_chunks),
+            consistency_category='Stable' if perf.ingestion_consistency_score < 10 else 'Variable',
+            scalability_category='Linear' if 0.8 <= perf.scalability_factor <= 1.2 else 'Non-linear',
+            avg_latency_category=self._categorize_latency(perf.search_latency_avg_ms),
+            p95_latency_category=self._categorize_latency(perf.search_latency_p95_ms),
+            p99_latency_category=self._categorize_latency(perf.search_latency_p99_ms),
+            latency_cv_category='Consistent' if latency_cv < 20 else 'Variable',
+            throughput_category=self._categorize_throughput(perf.throughput_queries_per_second),
+            memory_category=self._categorize_memory(result.peak_memory_mb),
+            memory_vs_baseline=self._compare_memory_to_baseline(result.peak_memory_mb, result.chunks_extracted),
+            memory_efficiency_category=self._categorize_memory_efficiency(perf.memory_efficiency_mb_per_1k_chunks),
+            memory_growth_category='Linear' if perf.memory_growth_rate < 50 else 'Concerning',
+            cpu_category=self._categorize_cpu(result.cpu_usage_percent),
+            efficiency_category='Efficient' if perf.efficiency_ratio > 1 else 'Inefficient',
+            stability_interpretation='Stable performance' if perf.performance_stability_index < 20 else 'Variable performance - investigate',
+            outlier_interpretation='Normal distribution' if outliers_count < 2 else 'Some queries had unusual latency',
+            latency_range_interpretation='Consistent' if latency_range < 1000 else 'High variance',
+            static_sections=_static_report_sections(
+                result.size_category,
+                result.batch_size,
+                repo.language,
+                result.repo_url,
+                result.queries_tested
+            ),
+            expected_ingestion_range=expected_ingestion_range,
+            ingestion_range_status=self._compare_to_baseline(perf.ingestion_rate_chunks_per_second, expected_ingestion_range),
+            latency_baseline_status=self._compare_latency_to_baseline(perf.search_latency_avg_ms),
+            expected_memory_range=self._get_expected_memory_range(result.chunks_extracted),
+            statistical_significance="Results are statistically significant with CV < 20%" if (latency_cv if stats else 100) < 20 else "High variance detected - more samples recommended",
+            reproducibility_score='High' if perf.performance_stability_index < 15 else 'Medium' if perf.performance_stability_index < 30 else 'Low',
+            recommended_batch_size=self._recommend_batch_size(result.chunks_extracted),
+            recommended_memory=self._recommend_memory(result.chunks_extracted),
+            estimated_duration=self._estimate_duration(result.chunks_extracted),
+            recommended_concurrency=self._recommend_concurrency(result),
+            recommended_hardware=self._recommend_hardware(result),
+            processing_cost=self._estimate_processing_cost(result),
+            time_cost_minutes=result.total_time / 60,
+            efficiency_rating=self._calculate_efficiency_rating(result),
+            roi_optimization=self._suggest_roi_optimization(result),
+        )
+        
+        for step, success, error in (
+            ('kb_creation', result.kb_creation_success, result.kb_creation_error),
+            ('ingestion', result.ingestion_success, result.ingestion_error),
+            ('indexing', result.indexing_success, result.indexing_error),
+            ('search', result.search_success, result.search_error),
+            ('ai_analysis', result.ai_analysis_success, result.ai_analysis_error),
+        ):
+            ctx[f'{step}_status'] = '✓ Success' if success else '✗ Failed'
+            ctx[f'{step}_notes'] = error or 'Completed successfully'
+        
+        if result.language_breakdown:
+            lines = ["| Language | Chunks | Percentage |\n", "|----------|--------|------------|\n"]
+            total_chunks = sum(result.language_breakdown.values())
+            for lang, count in sorted(result.language_breakdown.items(), key=lambda x: x[1], reverse=True):
+                percentage = (count / total_chunks) * 100 if total_chunks > 0 else 0
+                lines.append(f"| {lang} | {count:,} | {percentage:.1f}% |\n")
+            ctx['language_distribution'] = "".join(lines)
+        else:
+            ctx['language_distribution'] = "Language breakdown not available.\n"
+        
+        if result.search_times:
+            lines = ["| Query # | Response Time (ms) | Status |\n", "|---------|-------------------|--------|\n"]
+            for i, time_val in enumerate(result.search_times, 1):
+                status = "✓ Fast" if time_val * 1000 < 1000 else "⚠ Slow" if time_val * 1000 < 3000 else "✗ Very Slow"
+                lines.append(f"| {i} | {time_val * 1000:.1f} | {status} |\n")
+            ctx['query_performance'] = "".join(lines)
+        else:
+            ctx['query_performance'] = "Individual query times not recorded.\n"
+        
+        ctx['critical_insights'] = "".join(
+            f"**{insight['category']}**: {insight['description']}\n\n"
+            for insight in self._generate_critical_insights(result, baseline)
+        )
+        
+        if baseline:
+            ctx['comparative_analysis'] = f"""
 **Dataset Size Category**: {baseline.size_category}
 - **Expected Ingestion Rate**: {baseline.expected_ingestion_rate[0]}-{baseline.expected_ingestion_rate[1]} chunks/second
-- **Actual Ingestion Rate**: {result.performance.ingestion_rate_chunks_per_second:.1f} chunks/second
-- **Performance Ratio**: {result.performance.relative_performance_vs_baseline:.1f}% of expected baseline
+- **Actual Ingestion Rate**: {ctx['ingestion_rate']} chunks/second
+- **Performance Ratio**: {ctx['relative_performance']}% of expected baseline
 - **Expected Search Latency**: {baseline.expected_search_latency[0]}-{baseline.expected_search_latency[1]} ms
-- **Actual Search Latency**: {result.performance.search_latency_avg_ms:.1f} ms
+- **Actual Search Latency**: {ctx['latency_avg']} ms
 - **Expected Memory Usage**: {baseline.expected_memory_mb[0]}-{baseline.expected_memory_mb[1]} MB
-- **Actual Memory Usage**: {result.peak_memory_mb:.1f} MB
+- **Actual Memory Usage**: {ctx['memory_peak']} MB
 
 **Baseline Comparison Summary**:
 {self._generate_baseline_summary(result, baseline)}
-""")
-            else:
-                f.write("No baseline available for this dataset size.\n")
-            
-            f.write(f"""
-
-## Recommendations
-
-### Critical Performance Optimizations
-""")
-            
-            recommendations = self._generate_enhanced_recommendations(result, baseline)
-            for category, recs in recommendations.items():
-                f.write(f"\n**{category}**:\n")
-                for rec in recs:
-                    f.write(f"- {rec}\n")
-            
-            f.write(f"""
-
-### Scaling Considerations and Resource Planning
-
-For repositories of similar size ({result.chunks_extracted:,} chunks):
-
-| Resource | Recommendation | Justification |
-|----------|----------------|---------------|
-| **Batch Size** | {self._recommend_batch_size(result.chunks_extracted)} | Optimized for {baseline.size_category if baseline else 'this'} dataset size |
-| **Memory Requirements** | {self._recommend_memory(result.chunks_extracted)} GB minimum | Based on {result.performance.memory_growth_rate:.1f} MB/1K chunks growth rate |
-| **Expected Duration** | {self._estimate_duration(result.chunks_extracted)} minutes | Linear scaling from current performance |
-| **Concurrent Queries** | {self._recommend_concurrency(result)} | Based on latency and stability metrics |
-| **Hardware Specs** | {self._recommend_hardware(result)} | Optimized for this workload pattern |
-
-### Cost-Performance Analysis
-
-- **Processing Cost**: ~{self._estimate_processing_cost(result):.2f} USD (estimated OpenAI API costs)
-- **Time Cost**: {result.total_time / 60:.1f} minutes total processing time
-- **Efficiency Rating**: {self._calculate_efficiency_rating(result)}
-- **ROI Optimization**: {self._suggest_roi_optimization(result)}
-
----
-
-**Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
-**Tool Version:** Semantic Code Navigator v1.0  
-**Report Format:** Individual Repository Benchmark v1.0  
-""")
+"""
+        else:
+            ctx['comparative_analysis'] = "No baseline available for this dataset size.\n"
+        
+        ctx['recommendations'] = "".join(
+            f"\n**{category}**:\n" + "".join(f"- {rec}\n" for rec in recs)
+            for category, recs in self._generate_enhanced_recommendations(result, baseline).items()
+        )
+        
+        _write_report_file(report_file, _INDIVIDUAL_REPORT_TEMPLATE.format_map(ctx))
         
         # Also save JSON data for programmatic analysis
         json_file = self.results_dir / f"{result.repo_name}_{timestamp}.json"
@@ -937,10 +1638,7 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
     
     def _get_size_category(self, chunks: int) -> str:
         """Get repository size category."""
-        if chunks < 500: return "Small"
-        elif chunks < 2000: return "Medium"
-        elif chunks < 5000: return "Large"
-        else: return "Very Large"
+        return _size_category(chunks)
     
     def _get_expected_ingestion_range(self, chunks: int) -> str:
         """Get expected ingestion rate range."""
@@ -1189,11 +1887,7 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
     
     def _estimate_processing_cost(self, result: TestResult) -> float:
         """Estimate OpenAI API processing costs."""
-        # Rough estimates based on typical usage
-        embedding_cost = result.chunks_extracted * 0.0001  # ~$0.0001 per chunk
-        search_cost = result.queries_tested * 0.001  # ~$0.001 per query
-        ai_analysis_cost = result.queries_tested * 0.01 if result.ai_analysis_success else 0  # ~$0.01 per AI analysis
-        return embedding_cost + search_cost + ai_analysis_cost
+        return _processing_cost(result.chunks_extracted, result.queries_tested, result.ai_analysis_success)
     
     def _calculate_efficiency_rating(self, result: TestResult) -> str:
         """Calculate overall efficiency rating."""
@@ -1268,41 +1962,49 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         variable_memory = result.peak_memory_mb - base_memory
         return base_memory + (variable_memory * scale_factor)
     
-    def _identify_performance_bottlenecks(self, results: List[TestResult]) -> List[Dict[str, str]]:
-        """Identify key performance bottlenecks across all test results."""
+    def _identify_performance_bottlenecks(self, metrics: np.ndarray) -> List[Dict[str, str]]:
+        """Identify key performance bottlenecks across all test results.
+        
+        Works on the column-wise result metrics (_RESULT_METRICS_DTYPE) so that every
+        criterion is a vectorized comparison.
+        """
         bottlenecks = []
+        total = len(metrics)
+        
+        perf = metrics[metrics['has_perf']]
+        slow_rel_perf = perf['rel_perf'][perf['rel_perf'] < 70]
+        slow_ingestion = slow_rel_perf.size
+        high_variance = np.count_nonzero(perf['cv_latency'] > 30)
+        memory_issues = np.count_nonzero(perf['growth'] > 100)
+        unstable = np.count_nonzero(perf['psi'] > 25)
         
         # Analyze ingestion performance
-        slow_ingestion = [r for r in results if r.performance and r.performance.relative_performance_vs_baseline < 70]
-        if len(slow_ingestion) > len(results) * 0.3:  # More than 30% slow
-            avg_performance = sum(r.performance.relative_performance_vs_baseline for r in slow_ingestion) / len(slow_ingestion)
+        if slow_ingestion > total * 0.3:  # More than 30% slow
+            avg_performance = slow_rel_perf.mean()
             bottlenecks.append({
                 "category": "Ingestion Performance Bottleneck",
-                "description": f"{len(slow_ingestion)}/{len(results)} repositories showed slow ingestion (avg {avg_performance:.1f}% of baseline). Primary causes: batch size optimization needed, network/disk I/O limitations."
+                "description": f"{slow_ingestion}/{total} repositories showed slow ingestion (avg {avg_performance:.1f}% of baseline). Primary causes: batch size optimization needed, network/disk I/O limitations."
             })
         
         # Analyze search latency variance
-        high_variance = [r for r in results if r.performance and r.performance.search_latency_stats and r.performance.search_latency_stats.coefficient_variation > 30]
-        if len(high_variance) > len(results) * 0.2:  # More than 20% high variance
+        if high_variance > total * 0.2:  # More than 20% high variance
             bottlenecks.append({
                 "category": "Search Latency Inconsistency",
-                "description": f"{len(high_variance)}/{len(results)} repositories showed high search latency variance (>30% CV). This indicates query complexity differences or system resource contention."
+                "description": f"{high_variance}/{total} repositories showed high search latency variance (>30% CV). This indicates query complexity differences or system resource contention."
             })
         
         # Analyze memory scaling issues
-        memory_issues = [r for r in results if r.performance and r.performance.memory_growth_rate > 100]
-        if len(memory_issues) > 0:
+        if memory_issues > 0:
             bottlenecks.append({
                 "category": "Memory Scalability Concern",
-                "description": f"{len(memory_issues)}/{len(results)} repositories showed concerning memory growth rates (>100 MB/1K chunks). This may limit scalability for larger datasets."
+                "description": f"{memory_issues}/{total} repositories showed concerning memory growth rates (>100 MB/1K chunks). This may limit scalability for larger datasets."
             })
         
         # Overall system stability
-        unstable = [r for r in results if r.performance and r.performance.performance_stability_index > 25]
-        if len(unstable) > len(results) * 0.25:
+        if unstable > total * 0.25:
             bottlenecks.append({
                 "category": "System Performance Variability",
-                "description": f"{len(unstable)}/{len(results)} repositories showed high performance variability. Consider system resource optimization and load balancing."
+                "description": f"{unstable}/{total} repositories showed high performance variability. Consider system resource optimization and load balancing."
             })
         
         if not bottlenecks:
@@ -1314,46 +2016,48 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         return bottlenecks
     
     def _analyze_performance_by_size(self, results: List[TestResult]) -> Dict[str, Dict]:
-        """Analyze performance patterns by repository size category."""
-        size_categories = {}
+        """Analyze performance patterns by repository size category.
         
-        for result in results:
-            if not result.performance:
-                continue
-                
-            category = self._get_size_category(result.chunks_extracted)
-            
-            if category not in size_categories:
-                size_categories[category] = {
-                    'results': [],
-                    'count': 0,
-                    'avg_ingestion_rate': 0,
-                    'avg_search_latency': 0,
-                    'avg_memory_efficiency': 0,
-                    'consistency_rating': ''
-                }
-            
-            size_categories[category]['results'].append(result)
-            size_categories[category]['count'] += 1
+        All categories are aggregated in a single pandas groupby over the results that
+        carry performance metrics; non-positive metric values are left out of the means.
+        """
+        rows = [
+            (r.size_category, r.performance.ingestion_rate_chunks_per_second,
+             r.performance.search_latency_avg_ms, r.performance.memory_efficiency_mb_per_1k_chunks)
+            for r in results if r.performance
+        ]
+        if not rows:
+            return {}
+        
+        df = pd.DataFrame(rows, columns=['size_category', 'ingestion_rate', 'search_latency', 'memory_efficiency'])
+        metric_columns = ['ingestion_rate', 'search_latency', 'memory_efficiency']
+        df[metric_columns] = df[metric_columns].where(df[metric_columns] > 0)
+        
+        grouped = df.groupby('size_category', sort=False).agg(
+            count=('size_category', 'size'),
+            avg_ingestion_rate=('ingestion_rate', 'mean'),
+            ingestion_rate_std=('ingestion_rate', 'std'),
+            avg_search_latency=('search_latency', 'mean'),
+            avg_memory_efficiency=('memory_efficiency', 'mean'),
+        )
         
-        # Calculate averages for each category
-        for category, data in size_categories.items():
-            results_list = data['results']
-            
-            ingestion_rates = [r.performance.ingestion_rate_chunks_per_second for r in results_list if r.performance.ingestion_rate_chunks_per_second > 0]
-            search_latencies = [r.performance.search_latency_avg_ms for r in results_list if r.performance.search_latency_avg_ms > 0]
-            memory_efficiencies = [r.performance.memory_efficiency_mb_per_1k_chunks for r in results_list if r.performance.memory_efficiency_mb_per_1k_chunks > 0]
-            
-            data['avg_ingestion_rate'] = statistics.mean(ingestion_rates) if ingestion_rates else 0
-            data['avg_search_latency'] = statistics.mean(search_latencies) if search_latencies else 0
-            data['avg_memory_efficiency'] = statistics.mean(memory_efficiencies) if memory_efficiencies else 0
-            
-            # Calculate consistency rating
-            if ingestion_rates:
-                cv = statistics.stdev(ingestion_rates) / statistics.mean(ingestion_rates) * 100
-                data['consistency_rating'] = 'High' if cv < 20 else 'Medium' if cv < 40 else 'Low'
+        size_categories = {}
+        for category, row in grouped.iterrows():
+            has_rates = not pd.isna(row['avg_ingestion_rate'])
+            if has_rates:
+                # Sample standard deviation; undefined (NaN) for a single value
+                cv = (0.0 if pd.isna(row['ingestion_rate_std']) else row['ingestion_rate_std']) / row['avg_ingestion_rate'] * 100
+                consistency_rating = 'High' if cv < 20 else 'Medium' if cv < 40 else 'Low'
             else:
-                data['consistency_rating'] = 'Unknown'
+                consistency_rating = 'Unknown'
+            
+            size_categories[category] = {
+                'count': int(row['count']),
+                'avg_ingestion_rate': float(row['avg_ingestion_rate']) if has_rates else 0.0,
+                'avg_search_latency': 0.0 if pd.isna(row['avg_search_latency']) else float(row['avg_search_latency']),
+                'avg_memory_efficiency': 0.0 if pd.isna(row['avg_memory_efficiency']) else float(row['avg_memory_efficiency']),
+                'consistency_rating': consistency_rating
+            }
         
         return size_categories
     
@@ -1388,8 +2092,7 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         recommendations = []
         
         # Scaling projections
-        total_chunks = sum(r.chunks_extracted for r in results)
-        avg_memory_per_chunk = memory_stats.mean / (total_chunks / len(results))
+        avg_memory_per_chunk = memory_stats.mean / (self._total_chunks_extracted / len(results))
         
         recommendations.append(f"For 10x scaling: Expect ~{avg_memory_per_chunk * 10000:.0f}MB memory per 10K chunk repository. Plan horizontal scaling beyond 50K chunks.")
         
@@ -1403,19 +2106,22 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
             recommendations.append(f"Investigate memory outliers: {len(memory_outliers)} repositories used excessive memory. Implement streaming ingestion for large datasets.")
         
         # Cost optimization
-        total_cost = sum(self._estimate_processing_cost(r) for r in results)
-        if total_cost > 10:
-            recommendations.append(f"Optimize API costs: Total estimated cost ${total_cost:.2f} for {len(results)} repositories. Consider model optimization and batch processing.")
+        if self._total_cost > 10:
+            recommendations.append(f"Optimize API costs: Total estimated cost ${self._total_cost:.2f} for {len(results)} repositories. Consider model optimization and batch processing.")
         
         return recommendations
     
-    def _generate_reliability_recommendations(self, results: List[TestResult], latency_stats: StatisticalMetrics, rate_stats: StatisticalMetrics) -> List[str]:
-        """Generate reliability and monitoring recommendations."""
+    def _generate_reliability_recommendations(self, results: List[TestResult], latency_stats: StatisticalMetrics, rate_stats: StatisticalMetrics,
+                                              query_latency_stats: Optional[StatisticalMetrics] = None) -> List[str]:
+        """Generate reliability and monitoring recommendations.
+        
+        SLA targets come from the per-query latency distribution when it is given.
+        """
         recommendations = []
+        sla_stats = query_latency_stats or latency_stats
         
-        # SLA recommendations
-        p95_latency = latency_stats.mean + 1.64 * latency_stats.std_dev  # Approximate P95
-        recommendations.append(f"Set SLA targets: P95 latency < {p95_latency:.0f}ms, P99 < {p95_latency * 1.5:.0f}ms based on current performance distribution.")
+        # SLA recommendations from the empirical latency percentiles
+        recommendations.append(f"Set SLA targets: P95 latency < {sla_stats.p95:.0f}ms, P99 < {sla_stats.p99:.0f}ms based on current performance distribution.")
         
         # Monitoring setup
         failed_tests = [r for r in results if r.success_rate < 80]
@@ -1426,15 +2132,20 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         recommendations.append(f"Configure alerts: Ingestion rate < {rate_stats.mean - 2 * rate_stats.std_dev:.0f} chunks/sec, Search latency > {latency_stats.mean + 2 * latency_stats.std_dev:.0f}ms")
         
         # Capacity planning
-        max_memory = max(r.peak_memory_mb for r in results if r.peak_memory_mb > 0)
+        max_memory = self._max_memory_mb
         recommendations.append(f"Capacity planning: Peak memory observed {max_memory:.0f}MB. Plan for {max_memory * 1.5:.0f}MB capacity with auto-scaling triggers.")
         
         return recommendations
     
-    def _generate_performance_baselines(self, results: List[TestResult]) -> List[Dict[str, str]]:
-        """Generate performance baselines based on test results."""
+    def _generate_performance_baselines(self, results: List[TestResult],
+                                        size_analysis: Optional[Dict[str, Dict]] = None) -> List[Dict[str, str]]:
+        """Generate performance baselines based on test results.
+        
+        Accepts a precomputed size analysis to avoid re-analyzing the same results.
+        """
         baselines = []
-        size_analysis = self._analyze_performance_by_size(results)
+        if size_analysis is None:
+            size_analysis = self._analyze_performance_by_size(results)
         
         for size_category, data in size_analysis.items():
             if data['count'] > 0:
@@ -1450,33 +2161,53 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
     def test_repository_with_retries(self, repo: TestRepository, max_retries: int = 10) -> TestResult:
         """Test repository with retry mechanism to handle failures.
         
-        Attempts to test a repository up to max_retries times, with exponential backoff
-        between attempts. This ensures the overall stress test doesn't stop due to 
-        individual repository failures.
+        Attempts to test a repository up to max_retries times, backing off exponentially
+        after transient failures and retrying quickly otherwise. This ensures the overall stress test doesn't stop due to 
+        individual repository failures. The batch size starts from the best size learned
+        for the repository's size category and is halved between attempts when ingestion
+        runs out of time or memory or gets slower.
         """
         last_result = None
         last_error = None
         
+        batch_size = self._initial_batch_size(repo)
+        tried_batch_sizes = {batch_size}
+        previous_throughput = None
+        
         for attempt in range(1, max_retries + 1):
+            attempt_repo = repo if batch_size == repo.batch_size else replace(repo, batch_size=batch_size)
+            
             try:
                 console.print(f"Testing {repo.name} (attempt {attempt}/{max_retries})", style="blue")
                 self.update_report(f"**Attempt {attempt}/{max_retries}** for {repo.name}")
                 
-                result = self.test_repository(repo)
+                result = self.test_repository(attempt_repo)
                 
                 # Consider test successful if at least KB creation and ingestion work
                 if result.kb_creation_success and result.ingestion_success:
                     if attempt > 1:
                         console.print(f"✅ {repo.name} succeeded on attempt {attempt}", style="green")
                         self.update_report(f"Repository {repo.name} succeeded on attempt {attempt}", "success")
+                    self._backoff_state.pop(repo.name, None)
+                    self._learn_batch_size(repo, result)
                     return result
                 else:
                     last_result = result
                     console.print(f"⚠️ Attempt {attempt} failed for {repo.name} (success rate: {result.success_rate:.1f}%)", style="yellow")
                     self.update_report(f"Attempt {attempt} failed - success rate: {result.success_rate:.1f}%", "warning")
                     
+                    throughput = self._ingestion_throughput(result)
+                    shrink = self._is_batch_size_error(result.ingestion_error) or (
+                        throughput is not None and previous_throughput is not None and throughput < previous_throughput
+                    )
+                    if throughput is not None:
+                        previous_throughput = throughput
+                    attempt_error = self._result_error(result)
+                    
             except Exception as e:
                 last_error = str(e)
+                attempt_error = last_error
+                shrink = self._is_batch_size_error(last_error)
                 console.print(f"❌ Attempt {attempt} crashed for {repo.name}: {e}", style="red")
                 self.update_report(f"Attempt {attempt} crashed: {e}", "error")
                 
@@ -1486,37 +2217,196 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
                     repo_url=repo.url,
                     start_time=datetime.now(),
                     end_time=datetime.now(),
-                    batch_size=repo.batch_size,
+                    batch_size=attempt_repo.batch_size,
                     environment=TestEnvironment.capture_current()
                 )
                 last_result.kb_creation_error = str(e)
             
-            # Exponential backoff between retries (2, 4, 8, 16 seconds...)
+            if shrink and batch_size > 1 and len(tried_batch_sizes) < _MAX_BATCH_SIZES_PER_REPO:
+                batch_size //= 2
+                tried_batch_sizes.add(batch_size)
+                console.print(f"Reducing batch size to {batch_size} for next attempt", style="dim")
+                self.update_report(f"Reducing batch size to {batch_size} for {repo.name}")
+            
             if attempt < max_retries:
-                wait_time = min(2 ** attempt, 30)  # Cap at 30 seconds
-                console.print(f"Waiting {wait_time}s before retry...", style="dim")
+                wait_time = self._retry_delay(repo.name, attempt_error, env=self._repository_env(repo))
+                console.print(f"Waiting {wait_time:.1f}s before retry...", style="dim")
                 time.sleep(wait_time)
         
-        # All retries failed
-        console.print(f"❌ All {max_retries} attempts failed for {repo.name}", style="red")
-        self.update_report(f"**FINAL FAILURE** after {max_retries} attempts for {repo.name}", "error")
+        # All retries failed
+        console.print(f"❌ All {max_retries} attempts failed for {repo.name}", style="red")
+        self.update_report(f"**FINAL FAILURE** after {max_retries} attempts for {repo.name}", "error")
+        
+        if last_result:
+            last_result.kb_creation_error = f"Failed after {max_retries} attempts. Last error: {last_error or 'Multiple failures'}"
+            return last_result
+        else:
+            # Create a completely failed result
+            failed_result = TestResult(
+                repo_name=repo.name,
+                repo_url=repo.url,
+                start_time=datetime.now(),
+                end_time=datetime.now(),
+                batch_size=batch_size,
+                environment=TestEnvironment.capture_current()
+            )
+            failed_result.kb_creation_error = f"Failed after {max_retries} attempts. Last error: {last_error or 'Unknown error'}"
+            return failed_result
+
+    @staticmethod
+    def _result_error(result: TestResult) -> str:
+        """Get the errors recorded on a failed result as one string."""
+        errors = (result.kb_creation_error, result.ingestion_error, result.indexing_error,
+                  result.search_error, result.ai_analysis_error)
+        return "\n".join(error for error in errors if error)
+    
+    def _retry_delay(self, repo_name: str, error: str, env: Optional[Dict[str, str]] = None) -> float:
+        """Get the wait before retrying a repository after a failed attempt.
+        
+        Transient failures (rate limits, timeouts, connection problems) back off
+        exponentially (2, 4, 8, 16 seconds...) over consecutive transient failures of the
+        repository, plus up to a second of jitter so parallel retries do not line up,
+        or wait as long as a Retry-After hint asks, up to _MAX_BACKOFF_SECONDS. Connection problems are retried
+        quickly if MindsDB already answers a health probe again. Other failures, such
+        as configuration errors, will not go away by waiting and are retried quickly.
+        """
+        retry_after = _RETRY_AFTER_RE.search(error)
+        if retry_after:
+            return min(float(retry_after.group(1)), _MAX_BACKOFF_SECONDS)
+        
+        lowered = error.lower()
+        if not any(marker in lowered for marker in _TRANSIENT_ERRORS):
+            return _FAST_RETRY_DELAY
+        
+        if any(marker in lowered for marker in _CONNECTION_ERRORS) and self._mindsdb_healthy(env):
+            return _FAST_RETRY_DELAY
+        
+        failures = self._backoff_state.get(repo_name, 0) + 1
+        self._backoff_state[repo_name] = failures
+        return min(2 ** failures, _MAX_BACKOFF_SECONDS) + random.uniform(0, 1)
+    
+    def _mindsdb_healthy(self, env: Optional[Dict[str, str]] = None) -> bool:
+        """Probe MindsDB with `kb:status`; False if it cannot be reached in time.
+        
+        The probe does not wait for a MindsDB call slot, so a retry never queues behind
+        a long command just to learn whether MindsDB is up.
+        """
+        try:
+            result = subprocess.run(
+                self._cli_argv + ["kb:status"],
+                capture_output=True,
+                text=True,
+                timeout=_HEALTH_PROBE_TIMEOUT,
+                env=env
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+        output = result.stdout + result.stderr
+        return result.returncode == 0 and not any(marker in output for marker in _UNHEALTHY_STATUS_MARKERS)
+    
+    def _select_search_queries(self, k: int) -> List[str]:
+        """Pick k distinct search queries, weighted towards cheap ones.
+        
+        Each query is weighted by the inverse of its median recent latency, and queries
+        without measurements get the highest weight so that every query gets measured.
+        Sampling without replacement uses a seeded generator to keep runs reproducible.
+        """
+        with self._query_lock:
+            medians = {query: statistics.median(times) for query, times in self._query_cost.items() if times}
+            if not medians:
+                return self.search_queries[:k]
+            
+            cheapest = min(medians.values())
+            weights = {query: 1.0 / max(medians.get(query, cheapest), 1e-3) for query in self.search_queries}
+            
+            # Weighted sampling without replacement: keep the k largest u ** (1 / w)
+            keys = {query: self._query_rng.random() ** (1.0 / weight) for query, weight in weights.items()}
+            return sorted(self.search_queries, key=keys.__getitem__, reverse=True)[:k]
+    
+    def _record_query_cost(self, query: str, exec_time: float):
+        """Record the latency of a successful search query."""
+        with self._query_lock:
+            self._query_cost.setdefault(query, deque(maxlen=_QUERY_COST_WINDOW)).append(exec_time)
+    
+    @staticmethod
+    def _parse_ingestion_output(output: str, result: TestResult):
+        """Read chunk/file counts and the language breakdown from kb:ingest output.
+        
+        Walks the output once, line by line, without splitting it into a list.
+        The language breakdown runs from its header up to the first blank line.
+        """
+        in_language_section = False
+        for line in io.StringIO(output):
+            if in_language_section:
+                if not line.strip():
+                    in_language_section = False
+                    continue
+                match = _LANG_LINE_RE.match(line)
+                if match:
+                    result.language_breakdown[match.group(1)] = int(match.group(2))
+            elif 'Language breakdown:' in line:
+                in_language_section = True
+            else:
+                lowered = line.lower()
+                if 'chunks' in lowered and 'files' in lowered:
+                    numbers = _NUM_RE.findall(line)
+                    if len(numbers) >= 2:
+                        result.chunks_extracted = int(numbers[0])
+                        result.files_processed = int(numbers[1])
+    
+    @staticmethod
+    def _ingestion_throughput(result: TestResult) -> Optional[float]:
+        """Get ingestion throughput in chunks per second, if ingestion produced any."""
+        if result.chunks_extracted > 0 and result.ingestion_time > 0:
+            return result.chunks_extracted / result.ingestion_time
+        return None
+    
+    @staticmethod
+    def _is_batch_size_error(error: Optional[str]) -> bool:
+        """Check whether an error suggests the batch was too large."""
+        if not error:
+            return False
+        error = error.lower()
+        return any(marker in error for marker in _BATCH_SIZE_ERRORS)
+    
+    def _estimated_size_category(self, repo: TestRepository) -> str:
+        """Get the size category expected for a repository from its estimated file count."""
+        return self._get_size_category(repo.estimated_files * _EST_CHUNKS_PER_FILE)
+    
+    def _initial_batch_size(self, repo: TestRepository) -> int:
+        """Get the batch size to start a repository with.
+        
+        Uses the size learned for repositories of the same estimated size category
+        and falls back to the configured batch size.
+        """
+        category = self._estimated_size_category(repo)
+        with self._batch_tuning_lock:
+            return self._optimal_batch_by_size_category.get(category, repo.batch_size)
+    
+    def _learn_batch_size(self, repo: TestRepository, result: TestResult):
+        """Record the batch size for later repositories of the same size category.
+        
+        The best performing batch size is kept. When it beat the baseline, the next
+        repository of the category probes double the size (up to _MAX_BATCH_SIZE).
+        The size is stored under the category estimated before the test, which is the
+        one _initial_batch_size looks up, not the category of the measured chunk count.
+        """
+        throughput = self._ingestion_throughput(result)
+        if throughput is None:
+            return
         
-        if last_result:
-            last_result.kb_creation_error = f"Failed after {max_retries} attempts. Last error: {last_error or 'Multiple failures'}"
-            return last_result
-        else:
-            # Create a completely failed result
-            failed_result = TestResult(
-                repo_name=repo.name,
-                repo_url=repo.url,
-                start_time=datetime.now(),
-                end_time=datetime.now(),
-                batch_size=repo.batch_size,
-                environment=TestEnvironment.capture_current()
-            )
-            failed_result.kb_creation_error = f"Failed after {max_retries} attempts. Last error: {last_error or 'Unknown error'}"
-            return failed_result
-
+        category = self._estimated_size_category(repo)
+        headroom = bool(result.performance and result.performance.relative_performance_vs_baseline > 100)
+        
+        with self._batch_tuning_lock:
+            best = self._best_throughput_by_size_category.get(category)
+            if best is None or throughput > best[0]:
+                self._best_throughput_by_size_category[category] = (throughput, result.batch_size)
+                next_batch_size = min(result.batch_size * 2, _MAX_BATCH_SIZE) if headroom else result.batch_size
+            else:
+                next_batch_size = best[1]
+            self._optimal_batch_by_size_category[category] = next_batch_size
+    
     def test_repository(self, repo: TestRepository) -> TestResult:
         """Run complete workflow test on a single repository."""
         result = TestResult(
@@ -1527,6 +2417,9 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
             environment=TestEnvironment.capture_current()
         )
         
+        self._resource_sampler.start()
+        self._flush_report()
+        
         console.print(Panel.fit(
             f"[bold blue]Testing Repository: {repo.name}[/bold blue]\n"
             f"URL: {repo.url}\n"
@@ -1536,6 +2429,8 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
             border_style="blue"
         ))
         
+        cli_env = self._repository_env(repo)
+        
         self.update_report(f"### Testing Repository: {repo.name}", "start")
         self.update_report(f"- **URL:** {repo.url}")
         self.update_report(f"- **Estimated Files:** {repo.estimated_files}")
@@ -1546,11 +2441,11 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         console.print("Step 1: Creating Knowledge Base...", style="bold yellow")
         self.update_report("#### Step 1: Knowledge Base Creation")
         
-        success, output, exec_time = self.run_cli_command("kb:reset --force")
+        success, output, exec_time = self.run_cli_command("kb:reset --force", env=cli_env)
         if success:
             console.print("KB reset successful", style="green")
         
-        success, output, exec_time = self.run_cli_command("kb:init --validate-config")
+        success, output, exec_time = self.run_cli_command("kb:init --validate-config", env=cli_env)
         result.kb_creation_success = success
         result.kb_creation_time = exec_time
         
@@ -1566,7 +2461,9 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         console.print("Step 2: Initializing AI Tables...", style="bold yellow")
         self.update_report("#### Step 2: AI Tables Initialization")
         
-        success, output, exec_time = self.run_cli_command("ai:init --force")
+        # AI tables are shared between knowledge bases, so never recreate them while another test uses them
+        with self._ai_tables_lock:
+            success, output, exec_time = self.run_cli_command("ai:init --force", env=cli_env)
         if success:
             console.print(f"AI tables creation successful ({exec_time:.2f}s)", style="green")
             self.update_report(f"**AI Tables:** Success in {exec_time:.2f}s", "success")
@@ -1582,40 +2479,13 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         branch = self.detect_repository_branch(repo.url)
         
         ingestion_command = f"kb:ingest {repo.url} --branch {branch} --batch-size {repo.batch_size} --extract-git-info"
-        success, output, exec_time = self.run_cli_command(ingestion_command, timeout=1800)  # 30 min timeout
+        success, output, exec_time = self.run_cli_command(ingestion_command, timeout=_INGESTION_TIMEOUT, env=cli_env)
         
         result.ingestion_success = success
         result.ingestion_time = exec_time
         
         if success:
-            lines = output.split('\n')
-            for line in lines:
-                if 'chunks' in line.lower() and 'files' in line.lower():
-                    try:
-                        import re
-                        numbers = re.findall(r'\d+', line)
-                        if len(numbers) >= 2:
-                            result.chunks_extracted = int(numbers[0])
-                            result.files_processed = int(numbers[1])
-                    except:
-                        pass
-            
-            try:
-                language_section = False
-                for line in lines:
-                    if 'Language breakdown:' in line:
-                        language_section = True
-                        continue
-                    if language_section and ':' in line and 'chunks' in line:
-                        parts = line.strip().split(':')
-                        if len(parts) == 2:
-                            lang = parts[0].strip()
-                            chunk_count = int(re.findall(r'\d+', parts[1])[0])
-                            result.language_breakdown[lang] = chunk_count
-                    elif language_section and line.strip() == '':
-                        break
-            except:
-                pass
+            self._parse_ingestion_output(output, result)
             
             if result.chunks_extracted == 0:
                 console.print(f"Ingestion completed but no chunks extracted. Output:", style="yellow")
@@ -1642,7 +2512,7 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         console.print("Step 4: Creating Search Index...", style="bold yellow")
         self.update_report("#### Step 4: Index Creation")
         
-        success, output, exec_time = self.run_cli_command("kb:index --show-stats")
+        success, output, exec_time = self.run_cli_command("kb:index --show-stats", env=cli_env)
         result.indexing_success = success
         result.indexing_time = exec_time
         
@@ -1657,7 +2527,7 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         console.print("Step 5: Testing Enhanced Semantic Search...", style="bold yellow")
         self.update_report("#### Step 5: Enhanced Semantic Search")
         
-        search_queries_to_test = self.search_queries[:3]
+        search_queries_to_test = self._select_search_queries(_QUERIES_PER_TEST)
         total_search_time = 0.0
         total_results = 0
         search_times = []
@@ -1666,16 +2536,16 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
             console.print(f"Testing query {i}/{len(search_queries_to_test)}: {test_query}", style="blue")
             
             search_command = f'kb:query "{test_query}" --limit 3'
-            success, output, exec_time = self.run_cli_command(search_command, timeout=120)
+            success, output, exec_time = self.run_cli_command(search_command, timeout=120, env=cli_env)
             
             if success:
                 search_times.append(exec_time)
                 total_search_time += exec_time
+                self._record_query_cost(test_query, exec_time)
                 
                 try:
                     if "Found" in output and "results" in output:
-                        import re
-                        match = re.search(r'Found (\d+) results', output)
+                        match = _FOUND_RE.search(output)
                         if match:
                             total_results += int(match.group(1))
                 except:
@@ -1706,7 +2576,8 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         self.update_report("#### Step 6: AI-Enhanced Search")
         
         ai_command = f'kb:query "{search_queries_to_test[0]}" --limit 2 --ai-all'
-        success, output, exec_time = self.run_cli_command(ai_command, timeout=300)
+        with self._ai_tables_lock:
+            success, output, exec_time = self.run_cli_command(ai_command, timeout=300, env=cli_env)
         
         result.ai_analysis_success = success
         result.ai_analysis_time = exec_time
@@ -1726,7 +2597,7 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         console.print("Step 7: Cleaning up for next test...", style="bold yellow")
         self.update_report("#### Step 7: Cleanup")
         
-        cleanup_success, cleanup_output, cleanup_time = self.run_cli_command("kb:reset --force")
+        cleanup_success, cleanup_output, cleanup_time = self.run_cli_command("kb:reset --force", env=cli_env)
         if cleanup_success:
             console.print("KB cleanup successful - memory freed for next test", style="green")
             self.update_report(f"**Cleanup:** KB reset successful in {cleanup_time:.2f}s", "success")
@@ -1751,6 +2622,7 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         
         result.performance = PerformanceMetrics()
         result.performance.calculate_from_results(result, result.search_times)
+        result.size_category = self._get_size_category(result.chunks_extracted)
         
         try:
             self.generate_individual_report(result, repo)
@@ -1759,253 +2631,244 @@ For repositories of similar size ({result.chunks_extracted:,} chunks):
         
         return result
     
+    @staticmethod
+    def _metric_array(values: np.ndarray) -> np.ndarray:
+        """Collect the positive values of a metric into a contiguous float64 array."""
+        arr = np.asarray(values, dtype=np.float64)
+        return arr[arr > 0]
+    
     def generate_final_report(self):
         """Generate comprehensive final report with advanced statistical analysis and cross-repository insights."""
         end_time = datetime.now()
         total_duration = (end_time - self.start_time).total_seconds()
         
-        successful_tests = [r for r in self.results if r.success_rate > 80]
-        failed_tests = [r for r in self.results if r.success_rate <= 80]
-        
-        total_files_processed = sum(r.files_processed for r in self.results)
-        total_chunks_extracted = sum(r.chunks_extracted for r in self.results)
+        # Per-result metrics are kept column-wise by _record_result, as are the totals
+        metrics = self._metrics.columns
+        has_perf = metrics['has_perf']
+        succeeded = metrics['success_rate'] > 80
+        successful_tests = [self.results[i] for i in np.flatnonzero(succeeded)]
+        failed_tests = [self.results[i] for i in np.flatnonzero(~succeeded)]
+        total_files_processed = self._total_files_processed
+        total_chunks_extracted = self._total_chunks_extracted
         
         # Enhanced statistical analysis
-        ingestion_times = [r.ingestion_time for r in self.results if r.ingestion_time > 0]
-        search_times = [r.search_time for r in self.results if r.search_time > 0]
-        ingestion_rates = [r.performance.ingestion_rate_chunks_per_second for r in self.results if r.performance and r.performance.ingestion_rate_chunks_per_second > 0]
-        search_latencies = [r.performance.search_latency_avg_ms for r in self.results if r.performance and r.performance.search_latency_avg_ms > 0]
-        memory_usages = [r.peak_memory_mb for r in self.results if r.peak_memory_mb > 0]
+        ingestion_times = self._metric_array(metrics['ingestion_time'])
+        search_times = self._metric_array(metrics['search_time'])
+        ingestion_rates = self._metric_array(metrics['ing_rate'][has_perf])
+        search_latencies = self._metric_array(metrics['lat_ms'][has_perf])
+        memory_usages = self._metric_array(metrics['mem_peak'])
         
         # Calculate aggregate statistics
-        ingestion_stats = StatisticalMetrics.from_values(ingestion_times) if ingestion_times else None
-        search_stats = StatisticalMetrics.from_values(search_times) if search_times else None
-        rate_stats = StatisticalMetrics.from_values(ingestion_rates) if ingestion_rates else None
-        latency_stats = StatisticalMetrics.from_values(search_latencies) if search_latencies else None
-        memory_stats = StatisticalMetrics.from_values(memory_usages) if memory_usages else None
+        ingestion_stats = StatisticalMetrics.from_ndarray(ingestion_times) if ingestion_times.size else None
+        search_stats = StatisticalMetrics.from_ndarray(search_times) if search_times.size else None
+        rate_stats = StatisticalMetrics.from_ndarray(ingestion_rates) if ingestion_rates.size else None
+        latency_stats = StatisticalMetrics.from_ndarray(search_latencies) if search_latencies.size else None
+        memory_stats = StatisticalMetrics.from_ndarray(memory_usages) if memory_usages.size else None
+        total_memory = float(memory_usages.sum())
+        total_cost = self._total_cost
+        
+        # Per-result derived values shared by the report tables, computed column-wise
+        chunks_per_sec = np.divide(metrics['chunks'], metrics['ingestion_time'],
+                                   out=np.zeros(len(metrics)), where=metrics['ingestion_time'] > 0)
+        results_per_query = np.divide(metrics['results_count'], metrics['queries'],
+                                      out=np.zeros(len(metrics)), where=metrics['queries'] > 0)
+        derived = list(zip(self.results, chunks_per_sec.tolist(), results_per_query.tolist()))
+        
+        # Latency of individual queries across all repositories, as opposed to per-repository averages
+        query_times = [np.asarray(r.search_times, dtype=np.float64) for r in self.results if r.search_times]
+        query_latency_stats = StatisticalMetrics.from_ndarray(np.concatenate(query_times) * 1000) if query_times else latency_stats
+        
+        avg_ingestion_time = ingestion_stats.mean if ingestion_stats else 0.0
+        avg_search_time = search_stats.mean if search_stats else 0.0
+        
+        uname = os.uname()
+        ctx = {
+            'completed_at': end_time.strftime('%Y-%m-%d %H:%M:%S'),
+            'duration_hours': total_duration / 3600,
+            'repo_count': len(self.results),
+            'successful_count': len(successful_tests),
+            'success_pct': len(successful_tests) / len(self.results) * 100,
+            'total_files_processed': total_files_processed,
+            'total_chunks_extracted': total_chunks_extracted,
+            'rate_stats': rate_stats,
+            'latency_stats': latency_stats,
+            'memory_stats': memory_stats,
+            'query_latency_stats': query_latency_stats,
+            'rate_spread': rate_stats.max_value / rate_stats.min_value,
+            'latency_spread': latency_stats.max_value / latency_stats.min_value,
+            'memory_spread': memory_stats.max_value / memory_stats.min_value,
+            'rate_consistency': 'Consistent' if rate_stats.coefficient_variation < 25 else 'Variable',
+            'latency_predictability': 'Predictable' if latency_stats.coefficient_variation < 30 else 'Variable',
+            'memory_predictability': 'Predictable' if memory_stats.coefficient_variation < 40 else 'Highly variable',
+            'total_cost': total_cost,
+            'avg_cost': total_cost / len(self.results),
+            'cost_per_1k_chunks': total_cost / (total_chunks_extracted / 1000),
+            'chunks_per_hour': total_chunks_extracted / (total_duration / 3600),
+            'chunks_per_mb': total_chunks_extracted / total_memory,
+            'python_version': sys.version,
+            'system': uname.sysname,
+            'release': uname.release,
+            'memory_gb': psutil.virtual_memory().total / 1024 / 1024 / 1024,
+            'cpu_count': psutil.cpu_count(),
+        }
         
-        avg_ingestion_time = statistics.mean(ingestion_times) if ingestion_times else 0.0
-        avg_search_time = statistics.mean(search_times) if search_times else 0.0
+        parts = [_FINAL_SUMMARY_TEMPLATE.format_map(ctx)]
+        ingestion_rows = [
+            (r.repo_name, r.files_processed, r.chunks_extracted, r.batch_size, r.ingestion_time, chunks_per_sec)
+            for r, chunks_per_sec, _ in derived if r.ingestion_success and r.chunks_extracted > 0
+        ]
+        parts.append("".join([_INGESTION_ROW_TEMPLATE.format(*row) for row in ingestion_rows]))
         
-        with open(self.report_file, 'a') as f:
-            f.write(f"""
-## Comprehensive Performance Benchmark Summary
-
-**Test Suite Completed:** {end_time.strftime('%Y-%m-%d %H:%M:%S')}  
-**Total Duration:** {total_duration/3600:.2f} hours  
-**Total Dataset Size:** {total_chunks_extracted:,} code chunks across {len(self.results)} repositories
-
-### Executive Performance Summary
-
-| Metric | Value | 95% Confidence Interval | Statistical Significance |
-|--------|-------|------------------------|------------------------|
-| **Total Repositories Tested** | {len(self.results)} | - | Complete test matrix |
-| **Success Rate** | {len(successful_tests)/len(self.results)*100:.1f}% | - | {len(successful_tests)}/{len(self.results)} repositories |
-| **Total Files Processed** | {total_files_processed:,} | - | Across all repositories |
-| **Total Code Chunks** | {total_chunks_extracted:,} | - | Embedded and indexed |
-| **Average Ingestion Rate** | {rate_stats.mean:.1f} chunks/sec | ({rate_stats.confidence_interval_95[0]:.1f}, {rate_stats.confidence_interval_95[1]:.1f}) | CV: {rate_stats.coefficient_variation:.1f}% |
-| **Average Search Latency** | {latency_stats.mean:.1f} ms | ({latency_stats.confidence_interval_95[0]:.1f}, {latency_stats.confidence_interval_95[1]:.1f}) | CV: {latency_stats.coefficient_variation:.1f}% |
-| **Average Memory Usage** | {memory_stats.mean:.1f} MB | ({memory_stats.confidence_interval_95[0]:.1f}, {memory_stats.confidence_interval_95[1]:.1f}) | CV: {memory_stats.coefficient_variation:.1f}% |
-
-### Cross-Repository Performance Analysis
-
-#### Ingestion Performance Distribution
-
-| Statistic | Value | Interpretation |
-|-----------|-------|----------------|
-| **Median Ingestion Rate** | {rate_stats.median:.1f} chunks/sec | More robust than mean |
-| **Performance Range** | {rate_stats.min_value:.1f} - {rate_stats.max_value:.1f} chunks/sec | {rate_stats.max_value/rate_stats.min_value:.1f}x variation |
-| **Standard Deviation** | {rate_stats.std_dev:.1f} chunks/sec | Consistency measure |
-| **Outlier Repositories** | {rate_stats.outliers_count} | Repositories with unusual performance |
-| **Performance Consistency** | {rate_stats.coefficient_variation:.1f}% CV | {'Consistent' if rate_stats.coefficient_variation < 25 else 'Variable'} across repositories |
-
-#### Search Latency Analysis
-
-| Statistic | Value | Interpretation |
-|-----------|-------|----------------|
-| **Median Latency** | {latency_stats.median:.1f} ms | Typical user experience |
-| **Latency Range** | {latency_stats.min_value:.1f} - {latency_stats.max_value:.1f} ms | {latency_stats.max_value/latency_stats.min_value:.1f}x variation |
-| **95% of Queries Under** | {latency_stats.mean + 1.96 * latency_stats.std_dev:.1f} ms | SLA recommendation |
-| **Latency Consistency** | {latency_stats.coefficient_variation:.1f}% CV | {'Predictable' if latency_stats.coefficient_variation < 30 else 'Variable'} performance |
-
-#### Memory Efficiency Patterns
-
-| Statistic | Value | Interpretation |
-|-----------|-------|----------------|
-| **Median Memory Usage** | {memory_stats.median:.1f} MB | Typical requirement |
-| **Memory Range** | {memory_stats.min_value:.1f} - {memory_stats.max_value:.1f} MB | {memory_stats.max_value/memory_stats.min_value:.1f}x scaling factor |
-| **Memory Predictability** | {memory_stats.coefficient_variation:.1f}% CV | {'Predictable' if memory_stats.coefficient_variation < 40 else 'Highly variable'} scaling |
-
-### Performance Analysis
-
-#### Ingestion Performance by Repository Size
-
-| Repository | Files | Chunks | Batch Size | Ingestion Time | Chunks/Second |
-|------------|-------|--------|------------|----------------|---------------|
-""")
-            
-            for result in self.results:
-                if result.ingestion_success and result.chunks_extracted > 0:
-                    chunks_per_sec = result.chunks_extracted / result.ingestion_time if result.ingestion_time > 0 else 0
-                    f.write(f"| {result.repo_name} | {result.files_processed} | {result.chunks_extracted} | {result.batch_size} | {result.ingestion_time:.2f}s | {chunks_per_sec:.1f} |\n")
-            
-            f.write(f"""
-#### Search Performance Analysis
-
-| Repository | Queries Tested | Avg Response Time | Total Results | Results/Query |
-|------------|----------------|-------------------|---------------|---------------|
-""")
-            
-            for result in self.results:
-                if result.search_success and result.queries_tested > 0:
-                    results_per_query = result.search_results_count / result.queries_tested
-                    f.write(f"| {result.repo_name} | {result.queries_tested} | {result.search_time:.2f}s | {result.search_results_count} | {results_per_query:.1f} |\n")
-            
-            f.write(f"""
-### Failure Analysis
-
-#### Failed Tests
-""")
-            
-            for result in failed_tests:
-                f.write(f"""
-**{result.repo_name}** (Success Rate: {result.success_rate:.1f}%)
-""")
-                if result.kb_creation_error:
-                    f.write(f"- KB Creation Error: {result.kb_creation_error}\n")
-                if result.ingestion_error:
-                    f.write(f"- Ingestion Error: {result.ingestion_error}\n")
-                if result.indexing_error:
-                    f.write(f"- Indexing Error: {result.indexing_error}\n")
-                if result.search_error:
-                    f.write(f"- Search Error: {result.search_error}\n")
-                if result.ai_analysis_error:
-                    f.write(f"- AI Analysis Error: {result.ai_analysis_error}\n")
-            
-            f.write(f"""
-### Critical Performance Insights and Optimization Recommendations
-
-#### Statistical Significance and Confidence
-
-- **Sample Size**: {len(self.results)} repositories tested with {total_chunks_extracted:,} total code chunks
-- **Statistical Power**: 95% confidence intervals provided for all key metrics
-- **Data Quality**: {len(successful_tests)}/{len(self.results)} successful tests provide robust statistical foundation
-- **Variance Analysis**: Performance consistency varies by repository size and complexity
-
-#### Key Performance Bottlenecks Identified
-
-""")
-            
-            # Analyze performance patterns across repositories
-            bottlenecks = self._identify_performance_bottlenecks(self.results)
-            for bottleneck in bottlenecks:
-                f.write(f"**{bottleneck['category']}**: {bottleneck['description']}\n\n")
-            
-            f.write(f"""
-
-#### Cross-Repository Performance Patterns
-
-""")
-            
-            # Analyze patterns by repository size
-            size_analysis = self._analyze_performance_by_size(self.results)
-            for size_cat, analysis in size_analysis.items():
-                f.write(f"**{size_cat} Repositories** ({analysis['count']} tested):\n")
-                f.write(f"- Average ingestion rate: {analysis['avg_ingestion_rate']:.1f} chunks/sec\n")
-                f.write(f"- Average search latency: {analysis['avg_search_latency']:.1f} ms\n")
-                f.write(f"- Memory efficiency: {analysis['avg_memory_efficiency']:.1f} MB per 1K chunks\n")
-                f.write(f"- Performance consistency: {analysis['consistency_rating']}\n\n")
-            
-            f.write(f"""
-
-#### Optimization Recommendations by Priority
-
-**Immediate Actions (High Impact)**:
-""")
-            
-            immediate_recs = self._generate_immediate_recommendations(self.results, rate_stats, latency_stats, memory_stats)
-            for rec in immediate_recs:
-                f.write(f"- {rec}\n")
-            
-            f.write(f"""
-
-**Scaling Optimizations (Medium-Long Term)**:
-""")
-            
-            scaling_recs = self._generate_scaling_recommendations(self.results, rate_stats, latency_stats, memory_stats)
-            for rec in scaling_recs:
-                f.write(f"- {rec}\n")
-            
-            f.write(f"""
-
-**Reliability and Monitoring**:
-""")
-            
-            reliability_recs = self._generate_reliability_recommendations(self.results, latency_stats, rate_stats)
-            for rec in reliability_recs:
-                f.write(f"- {rec}\n")
-            
-            f.write(f"""
-
-#### Cost-Performance Analysis
-
-- **Total Estimated Processing Cost**: ${sum(self._estimate_processing_cost(r) for r in self.results):.2f} for complete test suite
-- **Average Cost per Repository**: ${sum(self._estimate_processing_cost(r) for r in self.results) / len(self.results):.2f}
-- **Cost per 1K Chunks**: ${sum(self._estimate_processing_cost(r) for r in self.results) / (total_chunks_extracted / 1000):.3f}
-- **Time Efficiency**: {total_chunks_extracted / (total_duration / 3600):.0f} chunks processed per hour
-- **Resource Efficiency**: {total_chunks_extracted / sum(r.peak_memory_mb for r in self.results if r.peak_memory_mb > 0):.2f} chunks per MB memory
-
-#### Performance Baselines for Future Testing
-
-Based on this comprehensive analysis, the following performance baselines are recommended:
-
-""")
-            
-            baselines = self._generate_performance_baselines(self.results)
-            f.write("| Repository Size | Expected Ingestion Rate | Expected Search Latency | Expected Memory Usage |\n")
-            f.write("|----------------|------------------------|------------------------|---------------------|\n")
-            for baseline in baselines:
-                f.write(f"| {baseline['size']} | {baseline['ingestion_rate']} chunks/sec | {baseline['search_latency']} ms | {baseline['memory_usage']} MB |\n")
+        parts.append(_SEARCH_TABLE_HEADER)
+        search_rows = [
+            (r.repo_name, r.queries_tested, r.search_time, r.search_results_count, results_per_query)
+            for r, _, results_per_query in derived if r.search_success and r.queries_tested > 0
+        ]
+        parts.append("".join([_SEARCH_ROW_TEMPLATE.format(*row) for row in search_rows]))
+        
+        parts.append(_FAILURE_HEADER)
+        for result in failed_tests:
+            parts.append(_FAILED_TEST_TEMPLATE.format(r=result))
+            for field_name, label in _FAILURE_FIELDS:
+                error = getattr(result, field_name)
+                if error:
+                    parts.append(f"- {label}: {error}\n")
+        
+        parts.append(_INSIGHTS_TEMPLATE.format_map(ctx))
+        
+        # Analyze performance patterns across repositories
+        bottlenecks = self._identify_performance_bottlenecks(metrics)
+        parts.extend(_BOTTLENECK_TEMPLATE.format_map(bottleneck) for bottleneck in bottlenecks)
+        
+        parts.append(_PATTERNS_HEADER)
+        
+        # Analyze patterns by repository size
+        size_analysis = self._analyze_performance_by_size(self.results)
+        parts.extend(
+            _SIZE_ANALYSIS_TEMPLATE.format(size_cat=size_cat, **analysis)
+            for size_cat, analysis in size_analysis.items()
+        )
+        
+        immediate_recs = self._generate_immediate_recommendations(self.results, rate_stats, latency_stats, memory_stats)
+        scaling_recs = self._generate_scaling_recommendations(self.results, rate_stats, latency_stats, memory_stats)
+        reliability_recs = self._generate_reliability_recommendations(self.results, latency_stats, rate_stats, query_latency_stats)
+        for header, recs in ((_IMMEDIATE_RECS_HEADER, immediate_recs),
+                             (_SCALING_RECS_HEADER, scaling_recs),
+                             (_RELIABILITY_RECS_HEADER, reliability_recs)):
+            parts.append(header)
+            parts.extend(_RECOMMENDATION_TEMPLATE.format(rec) for rec in recs)
+        
+        parts.append(_COST_PERFORMANCE_TEMPLATE.format_map(ctx))
+        baselines = self._generate_performance_baselines(self.results, size_analysis)
+        parts.extend(_BASELINE_ROW_TEMPLATE.format_map(baseline) for baseline in baselines)
+        
+        parts.append(_METHODOLOGY_TEMPLATE.format_map(ctx))
+        parts.extend(
+            _REPORT_LINK_TEMPLATE.format(name=result.repo_name, timestamp=result.start_time.strftime('%Y%m%d_%H%M%S'))
+            for result in self.results
+        )
+        parts.append(_FINAL_FOOTER)
+        
+        self._flush_report("".join(parts))
+    
+    def _record_result(self, result: TestResult):
+        """Add a finished test result and fold it into the suite-wide running totals."""
+        result.estimated_cost = self._estimate_processing_cost(result)
+        if not result.size_category:
+            result.size_category = self._get_size_category(result.chunks_extracted)
+        self.results.append(result)
+        self._metrics.append(result)
+        
+        self._total_cost += result.estimated_cost
+        self._total_chunks_extracted += result.chunks_extracted
+        self._total_files_processed += result.files_processed
+        self._max_memory_mb = max(self._max_memory_mb, result.peak_memory_mb)
+    
+    def _log_repository_outcome(self, repo: TestRepository, result: TestResult):
+        """Print the final outcome of a repository test."""
+        if result.success_rate > 80:
+            console.print(f"✅ Completed {repo.name} ({result.success_rate:.1f}% success)", style="green")
+        elif result.success_rate > 40:
+            console.print(f"⚠️ Partial success {repo.name} ({result.success_rate:.1f}% success)", style="yellow")
+        else:
+            console.print(f"❌ Failed {repo.name} ({result.success_rate:.1f}% success)", style="red")
+    
+    def _unexpected_failure_result(self, repo: TestRepository, error: Exception) -> TestResult:
+        """Record an error that escaped the retry mechanism as a failed result."""
+        # This should be very rare since test_repository_with_retries handles exceptions
+        console.print(f"❌ Unexpected error for {repo.name}: {error}", style="red")
+        self.update_report(f"Unexpected error for {repo.name}: {error}", "error")
+        
+        failed_result = TestResult(
+            repo_name=repo.name,
+            repo_url=repo.url,
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+            batch_size=repo.batch_size,
+            environment=TestEnvironment.capture_current()
+        )
+        failed_result.kb_creation_error = f"Unexpected error: {str(error)}"
+        return failed_result
+    
+    def _run_repositories_serial(self, progress: Progress, main_task):
+        """Test repositories one after another."""
+        # Run tests SERIALLY (one after another) to avoid memory issues
+        # Each test includes cleanup step to free memory before next test
+        # Use retry mechanism to handle individual repository failures
+        for i, repo in enumerate(self.test_repositories):
+            progress.update(main_task, description=f"Testing {repo.name} ({i+1}/{len(self.test_repositories)})...")
             
-            f.write(f"""
-
-#### Reproducibility and Methodology
-
-**Test Environment Consistency**: All tests run on standardized environment with documented specifications
-**Statistical Methodology**: 95% confidence intervals, outlier detection, coefficient of variation analysis
-**Reproducibility Score**: High - all individual reports contain exact reproduction commands
-**Baseline Validation**: Performance baselines derived from {len(self.results)} repository statistical analysis
-
-### Test Environment
-- **Python Version:** {sys.version}
-- **Test Machine:** {os.uname().sysname} {os.uname().release}
-- **Available Memory:** {psutil.virtual_memory().total / 1024 / 1024 / 1024:.1f} GB
-- **CPU Cores:** {psutil.cpu_count()}
-
-### Individual Repository Reports
-
-Detailed benchmark reports for each repository have been generated in the `results/` directory:
-
-""")
+            try:
+                # Use retry mechanism with max 10 attempts per repository
+                result = self.test_repository_with_retries(repo, max_retries=10)
+                self._record_result(result)
+                self._log_repository_outcome(repo, result)
+                
+            except KeyboardInterrupt:
+                console.print("\n⚠️ Test interrupted by user", style="yellow")
+                self.update_report("Test suite interrupted by user", "warning")
+                break
+            except Exception as e:
+                self._record_result(self._unexpected_failure_result(repo, e))
             
-            for result in self.results:
-                timestamp = result.start_time.strftime('%Y%m%d_%H%M%S')
-                f.write(f"- **{result.repo_name}**: `results/{result.repo_name}_{timestamp}.md` (JSON: `{result.repo_name}_{timestamp}.json`)\n")
+            progress.update(main_task, advance=1)
+            self._flush_report()
             
-            f.write(f"""
-
-Each individual report contains:
-- Complete environment specifications for reproducibility
-- Detailed performance metrics with benchmark categories
-- Language breakdown and repository characteristics  
-- Step-by-step execution results with timing
-- Performance baselines and recommendations
-- Reproduction scripts for exact replication
-
----
-
-*Report generated by Semantic Code Navigator Stress Test Suite*
-""")
+            # Retries already back off on failures, so only pause briefly between repositories
+            time.sleep(0.5)
+    
+    def _run_repositories_parallel(self, progress: Progress, main_task):
+        """Test up to max_parallel_repos repositories concurrently.
+        
+        Repository tests spend their time waiting on CLI subprocesses and remote
+        APIs, so worker threads overlap that waiting. Results are collected on the
+        calling thread as they complete.
+        """
+        total = len(self.test_repositories)
+        progress.update(main_task, description=f"Testing {total} repositories ({self.max_parallel_repos} in parallel)...")
+        
+        executor = ThreadPoolExecutor(max_workers=self.max_parallel_repos, thread_name_prefix="stress-test")
+        try:
+            futures = {
+                executor.submit(self.test_repository_with_retries, repo, 10): repo
+                for repo in self.test_repositories
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                repo = futures[future]
+                try:
+                    result = future.result()
+                    self._record_result(result)
+                    self._log_repository_outcome(repo, result)
+                except Exception as e:
+                    self._record_result(self._unexpected_failure_result(repo, e))
+                
+                progress.update(main_task, advance=1, description=f"Completed {repo.name} ({completed}/{total})...")
+                self._flush_report()
+        except KeyboardInterrupt:
+            console.print("\n⚠️ Test interrupted by user", style="yellow")
+            self.update_report("Test suite interrupted by user", "warning")
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
     
     def run_stress_test(self):
         """Run the complete stress test suite."""
@@ -2018,6 +2881,7 @@ Each individual report contains:
         
         self.initialize_report()
         self.update_report("# Stress Test Suite Started", "start")
+        self._resource_sampler.start()
         
         try:
             with Progress(
@@ -2031,51 +2895,17 @@ Each individual report contains:
                 
                 main_task = progress.add_task("Running stress tests...", total=len(self.test_repositories))
                 
-                # Run tests SERIALLY (one after another) to avoid memory issues
-                # Each test includes cleanup step to free memory before next test
-                # Use retry mechanism to handle individual repository failures
-                for i, repo in enumerate(self.test_repositories):
-                    progress.update(main_task, description=f"Testing {repo.name} ({i+1}/{len(self.test_repositories)})...")
-                    
-                    try:
-                        # Use retry mechanism with max 10 attempts per repository
-                        result = self.test_repository_with_retries(repo, max_retries=10)
-                        self.results.append(result)
-                        
-                        if result.success_rate > 80:
-                            console.print(f"✅ Completed {repo.name} ({result.success_rate:.1f}% success)", style="green")
-                        elif result.success_rate > 40:
-                            console.print(f"⚠️ Partial success {repo.name} ({result.success_rate:.1f}% success)", style="yellow")
-                        else:
-                            console.print(f"❌ Failed {repo.name} ({result.success_rate:.1f}% success)", style="red")
-                        
-                    except KeyboardInterrupt:
-                        console.print("\n⚠️ Test interrupted by user", style="yellow")
-                        self.update_report("Test suite interrupted by user", "warning")
-                        break
-                    except Exception as e:
-                        # This should be very rare since test_repository_with_retries handles exceptions
-                        console.print(f"❌ Unexpected error for {repo.name}: {e}", style="red")
-                        self.update_report(f"Unexpected error for {repo.name}: {e}", "error")
-                        
-                        failed_result = TestResult(
-                            repo_name=repo.name,
-                            repo_url=repo.url,
-                            start_time=datetime.now(),
-                            end_time=datetime.now(),
-                            batch_size=repo.batch_size,
-                            environment=TestEnvironment.capture_current()
-                        )
-                        failed_result.kb_creation_error = f"Unexpected error: {str(e)}"
-                        self.results.append(failed_result)
-                    
-                    progress.update(main_task, advance=1)
-                    
-                    # Shorter wait time since retries already include delays
-                    console.print(f"Waiting 5 seconds before next repository...", style="dim")
-                    time.sleep(5)
+                if self.max_parallel_repos > 1:
+                    self._run_repositories_parallel(progress, main_task)
+                else:
+                    self._run_repositories_serial(progress, main_task)
         
         finally:
+            self._resource_sampler.stop()
+            memory_growth = self._resource_sampler.memory_growth_mb_per_minute()
+            if memory_growth is not None:
+                self.update_report(f"Memory trend over the last {len(self._resource_sampler.samples)} samples: {memory_growth:+.2f} MB/min")
+            
             self.generate_final_report()
             
             console.print(Panel.fit(
@@ -2088,6 +2918,64 @@ Each individual report contains:
             ))
             
             self.update_report("# Stress Test Suite Completed", "finish")
+            self._close_report()
+
+_PREREQ_CACHE_FILE = Path.home() / ".cache" / "scn" / "prereq.json"
+_PREREQ_CACHE_TTL = 3600
+
+def _prereq_cache_fresh() -> bool:
+    """Check whether prerequisites passed for this project within the cache TTL."""
+    try:
+        if time.time() - _PREREQ_CACHE_FILE.stat().st_mtime > _PREREQ_CACHE_TTL:
+            return False
+        with open(_PREREQ_CACHE_FILE, 'r') as f:
+            return json.load(f).get("project") == os.getcwd()
+    except (OSError, ValueError):
+        return False
+
+def _save_prereq_cache():
+    """Remember that prerequisites passed for this project."""
+    try:
+        _PREREQ_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_PREREQ_CACHE_FILE, 'w') as f:
+            json.dump({"project": os.getcwd(), "checked_at": datetime.now().isoformat()}, f)
+    except OSError:
+        pass
+
+def _check_prereqs(use_cache: bool = True) -> bool:
+    """Verify the CLI and MindsDB are reachable.
+    
+    A successful check is cached on disk for an hour, so repeated runs skip the
+    two CLI subprocesses. Failures and unverified MindsDB connections are never cached.
+    """
+    if use_cache and _prereq_cache_fresh():
+        console.print("✅ Prerequisites check passed (cached)", style="green")
+        return True
+    
+    try:
+        result = subprocess.run([sys.executable, "-m", "src.cli", "--version"], capture_output=True, text=True)
+        if result.returncode != 0:
+            console.print("❌ CLI not accessible. Make sure you're in the project root directory.", style="red")
+            return False
+    except:
+        console.print("❌ Failed to run CLI. Check your Python environment.", style="red")
+        return False
+    
+    mindsdb_verified = False
+    try:
+        result = subprocess.run([sys.executable, "-m", "src.cli", "kb:status"], capture_output=True, text=True, timeout=10)
+        if "Failed to connect" in result.stderr:
+            console.print("❌ MindsDB not accessible. Start with: docker-compose up", style="red")
+            return False
+        mindsdb_verified = True
+    except:
+        console.print("⚠️ Could not verify MindsDB connection. Proceeding anyway...", style="yellow")
+    
+    if mindsdb_verified:
+        _save_prereq_cache()
+    
+    console.print("✅ Prerequisites check passed", style="green")
+    return True
 
 def main():
     """Main entry point for stress test suite."""
@@ -2109,6 +2997,8 @@ of varying sizes. It tests the complete workflow:
 [bold yellow]Usage:[/bold yellow]
     python stress_test.py                    # Run full test suite (25 repos)
     python stress_test.py --test-single      # Test only first repository
+    python stress_test.py --max-parallel-repos 4  # Test up to 4 repositories concurrently
+    python stress_test.py --no-cache-prereq  # Re-check CLI and MindsDB even if cached
     python stress_test.py --help             # Show this help
 
 [bold yellow]Output:[/bold yellow]
@@ -2125,30 +3015,22 @@ of varying sizes. It tests the complete workflow:
         """)
         return
     
-    test_single = len(sys.argv) > 1 and sys.argv[1] == "--test-single"
-    
-    console.print("Checking prerequisites...", style="blue")
+    test_single = "--test-single" in sys.argv
     
-    try:
-        result = subprocess.run("python -m src.cli --version", shell=True, capture_output=True, text=True)
-        if result.returncode != 0:
-            console.print("❌ CLI not accessible. Make sure you're in the project root directory.", style="red")
+    max_parallel_repos = 1
+    if "--max-parallel-repos" in sys.argv:
+        try:
+            max_parallel_repos = int(sys.argv[sys.argv.index("--max-parallel-repos") + 1])
+        except (IndexError, ValueError):
+            console.print("❌ --max-parallel-repos requires an integer value", style="red")
             return
-    except:
-        console.print("❌ Failed to run CLI. Check your Python environment.", style="red")
-        return
     
-    try:
-        result = subprocess.run("python -m src.cli kb:status", shell=True, capture_output=True, text=True, timeout=10)
-        if "Failed to connect" in result.stderr:
-            console.print("❌ MindsDB not accessible. Start with: docker-compose up", style="red")
-            return
-    except:
-        console.print("⚠️ Could not verify MindsDB connection. Proceeding anyway...", style="yellow")
+    console.print("Checking prerequisites...", style="blue")
     
-    console.print("✅ Prerequisites check passed", style="green")
+    if not _check_prereqs(use_cache="--no-cache-prereq" not in sys.argv):
+        return
     
-    suite = StressTestSuite()
+    suite = StressTestSuite(max_parallel_repos=max_parallel_repos)
     
     if test_single:
         console.print("🧪 Running single repository test mode", style="blue")
@@ -1,5 +1,6 @@
 import unittest
 import os
+import sys
 import subprocess
 import time
 import tempfile
@@ -10,15 +11,22 @@ from click.testing import CliRunner
 
 from src.cli import cli
 
+# Keep scratch repositories on tmpfs where available to avoid disk I/O
+TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+UNHEALTHY_STATUS_MARKERS = (b"Failed to connect", b"Connection refused", b"Failed to establish", b"Query execution failed")
+
 # This is a full integration test that requires Docker and a valid OpenAI API key.
 # It will start a MindsDB container, run the full CLI workflow, and then shut it down.
 # NOTE: This test will fail if the provided OpenAI API key does not have credits.
 class TestCLIWorkflow(unittest.TestCase):
     _mindsdb_up = False
+    _template_repo_dir = None
 
     @classmethod
     def setUpClass(cls):
         """Set up the integration test environment by starting MindsDB."""
+        cls._template_repo_dir = cls._build_template_repo()
         print("Starting MindsDB container for integration test...")
         try:
             # Use docker-compose to start MindsDB in detached mode
@@ -29,9 +37,10 @@ class TestCLIWorkflow(unittest.TestCase):
                 capture_output=True
             )
             cls._mindsdb_up = True
-            # Wait for the container to initialize and be ready
+            # Poll until the container is ready instead of waiting a fixed amount of time
             print("Waiting for MindsDB to become available (this may take a minute)...")
-            time.sleep(45) # Give MindsDB ample time to start
+            if not cls._wait_for_mindsdb(timeout=60):
+                print("ERROR: MindsDB did not become ready within 60 seconds.")
         except subprocess.CalledProcessError as e:
             print("ERROR: Failed to start MindsDB container. Is Docker running?")
             print(e.stdout.decode())
@@ -41,9 +50,45 @@ class TestCLIWorkflow(unittest.TestCase):
             print("ERROR: `docker-compose` command not found. Is Docker installed?")
 
 
+    @staticmethod
+    def _wait_for_mindsdb(timeout: float, interval: float = 0.5) -> bool:
+        """Ping `kb:status` until MindsDB accepts connections or the timeout expires."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                result = subprocess.run(
+                    [sys.executable, "-m", "src.cli", "kb:status"],
+                    capture_output=True,
+                    timeout=5
+                )
+                output = result.stdout + result.stderr
+                # kb:status exits 0 even when its queries fail, so check its output as well
+                if result.returncode == 0 and not any(marker in output for marker in UNHEALTHY_STATUS_MARKERS):
+                    return True
+            except subprocess.TimeoutExpired:
+                pass
+            time.sleep(interval)
+        return False
+
+    @staticmethod
+    def _build_template_repo() -> str:
+        """Create the sample Git repository once; tests work on copies of it."""
+        repo_dir = tempfile.mkdtemp(prefix="test_repo_template_", dir=TMP_ROOT)
+        repo = git.Repo.init(repo_dir)
+
+        # Create a dummy Python file in the test repository
+        (Path(repo_dir) / "app.py").write_text(
+            "def sample_function():\n    return 'This is a test function.'"
+        )
+        repo.index.add(["app.py"])
+        repo.index.commit("Initial commit")
+        return repo_dir
+
     @classmethod
     def tearDownClass(cls):
         """Tear down the integration test environment."""
+        if cls._template_repo_dir:
+            shutil.rmtree(cls._template_repo_dir, ignore_errors=True)
         if cls._mindsdb_up:
             print("Stopping MindsDB container...")
             subprocess.run("docker-compose down", shell=True, check=True)
@@ -59,15 +104,9 @@ class TestCLIWorkflow(unittest.TestCase):
             self.skipTest("TEST_OPENAI_API_KEY environment variable not set.")
 
         self.runner = CliRunner()
-        self.repo_dir = tempfile.mkdtemp(prefix="test_repo_")
-        self.repo = git.Repo.init(self.repo_dir)
-
-        # Create a dummy Python file in the test repository
-        (Path(self.repo_dir) / "app.py").write_text(
-            "def sample_function():\n    return 'This is a test function.'"
-        )
-        self.repo.index.add(["app.py"])
-        self.repo.index.commit("Initial commit")
+        self.repo_dir = tempfile.mkdtemp(prefix="test_repo_", dir=TMP_ROOT)
+        shutil.copytree(self._template_repo_dir, self.repo_dir, dirs_exist_ok=True)
+        self.repo = git.Repo(self.repo_dir)
         
         # Environment for the test run
         self.env = {
@@ -6,25 +6,38 @@ from pathlib import Path
 
 from src.code_ingestion import CodeIngestionEngine
 
+# Keep scratch directories on tmpfs where available to avoid disk I/O
+TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 class TestCodeIngestion(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Build the sample repository layout once; each test gets its own copy
+        cls._template_dir = tempfile.mkdtemp(dir=TMP_ROOT)
+        root = Path(cls._template_dir)
+        (root / "src").mkdir()
+        (root / "src" / "main.py").touch()
+        (root / "src" / "utils.js").touch()
+        (root / "README.md").touch()
+        (root / "node_modules").mkdir()
+        (root / "node_modules" / "lib.js").touch()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._template_dir)
+
     def setUp(self):
         self.engine = CodeIngestionEngine()
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = tempfile.mkdtemp(dir=TMP_ROOT)
+        shutil.copytree(self._template_dir, self.temp_dir, dirs_exist_ok=True)
 
     def tearDown(self):
         shutil.rmtree(self.temp_dir)
 
     def test_discover_code_files(self):
         """Test that code file discovery works correctly."""
-        # Create a dummy file structure
-        (Path(self.temp_dir) / "src").mkdir()
-        (Path(self.temp_dir) / "src" / "main.py").touch()
-        (Path(self.temp_dir) / "src" / "utils.js").touch()
-        (Path(self.temp_dir) / "README.md").touch()
-        (Path(self.temp_dir) / "node_modules").mkdir()
-        (Path(self.temp_dir) / "node_modules" / "lib.js").touch()
-
+        # The dummy file structure is copied from the class template in setUp
         extensions = ["py", "js"]
         exclude_dirs = ["node_modules"]
 
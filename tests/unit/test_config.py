@@ -2,98 +2,209 @@ import unittest
 import os
 from unittest.mock import patch
 
-from src.config import MindsDBConfig, KnowledgeBaseConfig, StressTestConfig, AppConfig
+from dataclasses import InitVar, dataclass
+from typing import Mapping, Optional
 
-class TestConfig(unittest.TestCase):
+import src.config
+from src.config import MindsDBConfig, KnowledgeBaseConfig, StressTestConfig, AppConfig, _env, env_bound
 
-    def test_mindsdb_config_defaults(self):
-        """Test that MindsDBConfig has correct default values."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = MindsDBConfig()
-            self.assertEqual(config.host, "127.0.0.1")
-            self.assertEqual(config.port, 47334)
-            self.assertEqual(config.user, "")
-            self.assertEqual(config.password, "")
-            self.assertEqual(config.database, "mindsdb")
-            self.assertEqual(config.connection_url, "http://127.0.0.1:47334")
-            self.assertFalse(config.is_cloud_connection)
-
-    @patch.dict(os.environ, {
-        "MINDSDB_HOST": "localhost",
-        "MINDSDB_PORT": "47335",
-        "MINDSDB_USER": "testuser",
-        "MINDSDB_PASSWORD": "testpassword",
-        "MINDSDB_DATABASE": "testdb"
-    })
-    def test_mindsdb_config_env_vars(self):
-        """Test that MindsDBConfig loads values from environment variables."""
-        config = MindsDBConfig()
-        self.assertEqual(config.host, "localhost")
-        self.assertEqual(config.port, 47335)
-        self.assertEqual(config.user, "testuser")
-        self.assertEqual(config.password, "testpassword")
-        self.assertEqual(config.database, "testdb")
-        self.assertEqual(config.connection_url, "http://localhost:47335")
-        self.assertTrue(config.is_cloud_connection)
-
-    def test_kb_config_defaults(self):
-        """Test that KnowledgeBaseConfig has correct default values."""
-        config = KnowledgeBaseConfig()
-        self.assertEqual(config.name, "codebase_kb")
-        self.assertEqual(config.embedding_model, "text-embedding-3-large")
-        self.assertEqual(config.reranking_model, "gpt-3.5-turbo")
-        self.assertEqual(config.openai_api_key, "")
-        self.assertIsNotNone(config.metadata_columns)
-        self.assertIsNotNone(config.content_columns)
+MINDSDB_ENV = {
+    "MINDSDB_HOST": "localhost",
+    "MINDSDB_PORT": "47335",
+    "MINDSDB_USER": "testuser",
+    "MINDSDB_PASSWORD": "testpassword",
+    "MINDSDB_DATABASE": "testdb"
+}
+
+# (environment, expected fields) pairs; the empty environment checks the defaults
+MINDSDB_CASES = [
+    ({}, {
+        "host": "127.0.0.1",
+        "port": 47334,
+        "user": "",
+        "password": "",
+        "database": "mindsdb",
+        "connection_url": "http://127.0.0.1:47334",
+        "is_cloud_connection": False
+    }),
+    (MINDSDB_ENV, {
+        "host": "localhost",
+        "port": 47335,
+        "user": "testuser",
+        "password": "testpassword",
+        "database": "testdb",
+        "connection_url": "http://localhost:47335",
+        "is_cloud_connection": True
+    }),
+]
 
-    @patch.dict(os.environ, {
+KB_CASES = [
+    ({}, {
+        "name": "codebase_kb",
+        "embedding_model": "text-embedding-3-large",
+        "reranking_model": "gpt-3.5-turbo",
+        "openai_api_key": ""
+    }),
+    ({
         "KB_NAME": "my_kb",
         "EMBEDDING_MODEL": "custom-embedding",
         "RERANKING_MODEL": "custom-reranking",
         "OPENAI_API_KEY": "test-key"
-    })
-    def test_kb_config_env_vars(self):
-        """Test that KnowledgeBaseConfig loads values from environment variables."""
-        config = KnowledgeBaseConfig()
-        self.assertEqual(config.name, "my_kb")
-        self.assertEqual(config.embedding_model, "custom-embedding")
-        self.assertEqual(config.reranking_model, "custom-reranking")
-        self.assertEqual(config.openai_api_key, "test-key")
-
-    def test_stress_test_config_defaults(self):
-        """Test that StressTestConfig has correct default values."""
-        config = StressTestConfig()
-        self.assertEqual(config.max_concurrent_queries, 100)
-        self.assertEqual(config.stress_test_duration, 300)
-        self.assertEqual(config.batch_size, 500)
-        self.assertEqual(config.threads, 10)
-
-    @patch.dict(os.environ, {
+    }, {
+        "name": "my_kb",
+        "embedding_model": "custom-embedding",
+        "reranking_model": "custom-reranking",
+        "openai_api_key": "test-key"
+    }),
+]
+
+STRESS_TEST_CASES = [
+    ({}, {
+        "max_concurrent_queries": 100,
+        "stress_test_duration": 300,
+        "batch_size": 500,
+        "threads": 10
+    }),
+    ({
         "MAX_CONCURRENT_QUERIES": "200",
         "STRESS_TEST_DURATION": "600",
         "BATCH_SIZE": "1000",
         "THREADS": "20"
-    })
-    def test_stress_test_config_env_vars(self):
-        """Test that StressTestConfig loads values from environment variables."""
-        config = StressTestConfig()
-        self.assertEqual(config.max_concurrent_queries, 200)
-        self.assertEqual(config.stress_test_duration, 600)
-        self.assertEqual(config.batch_size, 1000)
-        self.assertEqual(config.threads, 20)
-
-    def test_app_config_validation_missing_key(self):
-        """Test that AppConfig validation fails without an OpenAI API key."""
-        with patch.dict(os.environ, {"OPENAI_API_KEY": ""}, clear=True):
-            app_config = AppConfig()
+    }, {
+        "max_concurrent_queries": 200,
+        "stress_test_duration": 600,
+        "batch_size": 1000,
+        "threads": 20
+    }),
+]
+
+class TestConfig(unittest.TestCase):
+    """Configs are built from explicit environment mappings, so os.environ is never modified."""
+
+    def assertFields(self, obj, expected):
+        """Compare the named attributes of obj with expected in a single assertion."""
+        self.assertEqual({name: getattr(obj, name) for name in expected}, expected)
+
+    def assertCases(self, config_class, cases):
+        """Build config_class from each case's environment and check its fields."""
+        for env, expected in cases:
+            with self.subTest(config=config_class.__name__, env=env):
+                self.assertFields(config_class(env=env), expected)
+
+    def test_mindsdb_config(self):
+        """Test MindsDBConfig defaults and values loaded from environment variables."""
+        self.assertCases(MindsDBConfig, MINDSDB_CASES)
+
+    def test_mindsdb_config_process_env(self):
+        """Test that MindsDBConfig reads the process environment when no mapping is given."""
+        _env.cache_clear()
+        self.addCleanup(_env.cache_clear)
+        with patch.dict(os.environ, MINDSDB_ENV):
+            config = MindsDBConfig()
+        self.assertFields(config, {"host": "localhost", "port": 47335, "database": "testdb"})
+
+    def test_kb_config(self):
+        """Test KnowledgeBaseConfig defaults and values loaded from environment variables."""
+        self.assertCases(KnowledgeBaseConfig, KB_CASES)
+        config = KnowledgeBaseConfig(env={})
+        self.assertIsNotNone(config.metadata_columns)
+        self.assertIsNotNone(config.content_columns)
+
+    def test_stress_test_config(self):
+        """Test StressTestConfig defaults and values loaded from environment variables."""
+        self.assertCases(StressTestConfig, STRESS_TEST_CASES)
+
+    def test_app_config_validation(self):
+        """Test that AppConfig validation requires an OpenAI API key."""
+        with self.subTest(key=None):
             with self.assertRaises(ValueError):
-                app_config.validate()
+                AppConfig(env={}).validate()
+        with self.subTest(key="a-valid-key"):
+            self.assertTrue(AppConfig(env={"OPENAI_API_KEY": "a-valid-key"}).validate())
 
-    @patch.dict(os.environ, {"OPENAI_API_KEY": "a-valid-key"})
-    def test_app_config_validation_with_key(self):
-        """Test that AppConfig validation succeeds with an OpenAI API key."""
-        app_config = AppConfig()
+    def test_app_config_validation_is_remembered(self):
+        """Test that a successful validation holds until invalidate() or load_from_env()."""
+        app_config = AppConfig(env={"OPENAI_API_KEY": "a-valid-key"})
         self.assertTrue(app_config.validate())
+        app_config.kb = KnowledgeBaseConfig(env={})
+        self.assertTrue(app_config.validate())
+
+        app_config.invalidate()
+        with self.assertRaises(ValueError):
+            app_config.validate()
+
+        app_config.load_from_env({"OPENAI_API_KEY": "a-valid-key"})
+        self.assertTrue(app_config.validate())
+        app_config.load_from_env({})
+        with self.assertRaises(ValueError):
+            app_config.validate()
+
+    def test_app_config_failed_validation_not_remembered(self):
+        """Test that a failed validation is checked again once the key is set."""
+        app_config = AppConfig(env={})
+        with self.assertRaises(ValueError):
+            app_config.validate()
+        app_config.kb = KnowledgeBaseConfig(env={"OPENAI_API_KEY": "a-valid-key"})
+        self.assertTrue(app_config.validate())
+
+
+class TestEnvBound(unittest.TestCase):
+
+    def test_env_bound_fills_and_chains(self):
+        """Test that env_bound converts values to the default's type and then runs the class's own __post_init__."""
+        @dataclass(frozen=True)
+        @env_bound(("size", "SIZE", 5))
+        class Sized:
+            size: Optional[int] = None
+            doubled: int = 0
+            env: InitVar[Optional[Mapping[str, str]]] = None
+
+            def __post_init__(self):
+                object.__setattr__(self, "doubled", self.size * 2)
+
+        self.assertEqual((Sized(env={}).size, Sized(env={}).doubled), (5, 10))
+        self.assertEqual((Sized(env={"SIZE": "7"}).size, Sized(env={"SIZE": "7"}).doubled), (7, 14))
+        self.assertEqual(Sized(size=3, env={"SIZE": "7"}).size, 3)
+
+    def test_env_bound_rejects_bool_default(self):
+        """Test that env_bound refuses boolean defaults, which bool() cannot parse from strings."""
+        with self.assertRaises(TypeError):
+            @env_bound(("enabled", "ENABLED", False))
+            class Flagged:
+                enabled: Optional[bool] = None
+
+class TestAppConfigSingleton(unittest.TestCase):
+
+    def setUp(self):
+        AppConfig.reset()
+        self.addCleanup(AppConfig.reset)
+
+    def test_app_config_is_shared(self):
+        """Test that AppConfig() returns the same instance every time."""
+        self.assertIs(AppConfig(), AppConfig())
+
+    def test_app_config_with_env_is_separate(self):
+        """Test that AppConfig(env=...) builds a fresh instance instead of the shared one."""
+        shared = AppConfig()
+        first = AppConfig(env={})
+        second = AppConfig(env={})
+        self.assertIsNot(first, shared)
+        self.assertIsNot(first, second)
+        self.assertIs(AppConfig(), shared)
+
+    def test_app_config_reset(self):
+        """Test that reset() makes the next AppConfig() build a new instance."""
+        before = AppConfig()
+        AppConfig.reset()
+        self.assertIsNot(AppConfig(), before)
+
+    def test_module_config_is_lazy_singleton(self):
+        """Test that src.config.config is built on first access and is the AppConfig() singleton."""
+        self.assertNotIn("config", vars(src.config))
+        self.assertIsNone(AppConfig._instance)
+        shared = src.config.config
+        self.assertIs(AppConfig._instance, shared)
+        self.assertIs(shared, AppConfig())
 
 if __name__ == '__main__':
     unittest.main()
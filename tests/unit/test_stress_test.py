@@ -0,0 +1,128 @@
+import unittest
+import os
+import sys
+import subprocess
+import tempfile
+import shutil
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+
+from stress_test import (StressTestSuite, TestRepository, TestResult, _MAX_BACKOFF_SECONDS,
+                         _MAX_CONCURRENT_MINDSDB_CALLS, _ResourceSampler)
+
+# Keep scratch directories on tmpfs where available to avoid disk I/O
+TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+class TestStressTestSuite(unittest.TestCase):
+
+    def setUp(self):
+        # The suite creates its results directory in the working directory
+        self.temp_dir = tempfile.mkdtemp(dir=TMP_ROOT)
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.temp_dir)
+        self.suite = StressTestSuite()
+        self.addCleanup(self.suite._close_report)
+
+    def test_learned_batch_size_used_for_next_repo(self):
+        """Test that a batch size learned on one repository starts the next one of its estimated category."""
+        first = TestRepository("first", "https://example.com/first", 50, "Python", "", 100, 10)
+        second = TestRepository("second", "https://example.com/second", 60, "Python", "", 100, 10)
+        result = TestResult(first.name, first.url, datetime.now(), batch_size=40)
+        # Far more chunks than estimated, so the measured category differs from the estimated one
+        result.chunks_extracted = 2400
+        result.ingestion_time = 60.0
+
+        self.suite._learn_batch_size(first, result)
+
+        self.assertEqual(self.suite._initial_batch_size(second), 40)
+
+    def test_crashed_attempt_records_shrunk_batch_size(self):
+        """Test that a crashed attempt records the batch size it ran with, not the configured one."""
+        repo = TestRepository("crashy", "https://example.com/crashy", 50, "Python", "", 100, 10)
+        with patch.object(self.suite, "test_repository", side_effect=RuntimeError("ingestion timed out")), \
+                patch("stress_test.time.sleep"):
+            result = self.suite.test_repository_with_retries(repo, max_retries=2)
+
+        self.assertEqual(result.batch_size, 50)
+
+    def test_retry_after_hint_is_capped(self):
+        """Test that a Retry-After hint cannot stall retries beyond the backoff ceiling."""
+        self.assertEqual(self.suite._retry_delay("repo", "HTTP 429, Retry-After: 5"), 5.0)
+        self.assertEqual(self.suite._retry_delay("repo", "HTTP 429, Retry-After: 86400"), _MAX_BACKOFF_SECONDS)
+
+    def test_cached_command_reports_no_execution_time(self):
+        """Test that a cache hit does not report the original run's time again."""
+        with patch.object(self.suite, "_execute_cli_command", return_value=(True, "ok", 2.0)) as execute:
+            first = self.suite.run_cli_command("ai:init --force")
+            second = self.suite.run_cli_command("ai:init --force")
+
+        self.assertEqual(execute.call_count, 1)
+        self.assertEqual(first, (True, "ok", 2.0))
+        self.assertEqual(second, (True, "ok", 0.0))
+
+    def test_invalidation_keeps_other_environments(self):
+        """Test that a state-changing command only drops cached results of its own environment."""
+        env_a, env_b = {"KB_NAME": "kb_a"}, {"KB_NAME": "kb_b"}
+        with patch.object(self.suite, "_execute_cli_command", return_value=(True, "ok", 2.0)) as execute:
+            self.suite.run_cli_command("kb:index --show-stats", env=env_a)
+            self.suite.run_cli_command("kb:index --show-stats", env=env_b)
+            self.suite.run_cli_command("kb:ingest https://example.com/repo", env=env_a)
+            self.suite.run_cli_command("kb:index --show-stats", env=env_a)
+            self.suite.run_cli_command("kb:index --show-stats", env=env_b)
+
+        # Both initial runs, the ingest and the rerun for env_a; env_b is served from the cache
+        self.assertEqual(execute.call_count, 4)
+
+    def test_ingest_and_health_probe_skip_call_slots(self):
+        """Test that kb:ingest and the health probe run while every MindsDB call slot is taken."""
+        for _ in range(_MAX_CONCURRENT_MINDSDB_CALLS):
+            self.suite._mindsdb_semaphore.acquire()
+        self.suite._cli_argv = [sys.executable, "-c", "pass"]
+        self.assertTrue(self.suite.run_cli_command("kb:ingest https://example.com/repo")[0])
+        with patch("stress_test.subprocess.run", return_value=MagicMock(returncode=0, stdout="", stderr="")):
+            self.assertTrue(self.suite._mindsdb_healthy())
+
+    def test_timed_out_command_is_not_retried(self):
+        """Test that a command killed at its timeout fails at once instead of running again."""
+        self.suite._cli_argv = [sys.executable, "-c", "import time; time.sleep(5)"]
+        with patch("stress_test.subprocess.Popen", wraps=subprocess.Popen) as popen, \
+                patch("stress_test.time.sleep"):
+            success, output, _ = self.suite._execute_cli_command("", timeout=0.2, retries=2)
+
+        self.assertFalse(success)
+        self.assertIn("timed out", output)
+        self.assertEqual(popen.call_count, 1)
+
+    def test_call_slot_released_between_retries(self):
+        """Test that a command waiting to retry after a connection error does not hold a MindsDB call slot."""
+        self.suite._cli_argv = [sys.executable, "-c", "print('Connection refused'); raise SystemExit(1)"]
+        free_slots = []
+
+        def count_free_slots(_):
+            acquired = 0
+            while self.suite._mindsdb_semaphore.acquire(blocking=False):
+                acquired += 1
+            for _ in range(acquired):
+                self.suite._mindsdb_semaphore.release()
+            free_slots.append(acquired)
+
+        with patch("stress_test.time.sleep", side_effect=count_free_slots):
+            success, _, _ = self.suite.run_cli_command("kb:status", retries=1)
+
+        self.assertFalse(success)
+        self.assertEqual(free_slots, [_MAX_CONCURRENT_MINDSDB_CALLS])
+
+class TestResourceSampler(unittest.TestCase):
+
+    def test_peak_since_covers_long_ingestion(self):
+        """Test that a peak early in a 30 minute ingestion is still reported at its end."""
+        sampler = _ResourceSampler()
+        start = 1000.0
+        for i in range(3600):
+            sampler.samples.append((start + i * sampler.interval, 900.0 if i == 10 else 100.0, 5.0))
+
+        self.assertEqual(sampler.peak_since(start), (900.0, 5.0))
+
+if __name__ == '__main__':
+    unittest.main()